@@ -0,0 +1,13 @@
+# functional/utils/constants.py
+# --------- universe ---------
+DOW_30: tuple[str, ...] = (
+    "MSFT","AAPL","NVDA","AMZN","WMT","JPM","V","HD","PG","JNJ",
+    "UNH","KO","CRM","CVX","CSCO","IBM","MCD","AXP","MRK","DIS",
+    "VZ","GS","CAT","BA","AMGN","HON","NKE","SHW","MMM","TRV",
+)
+
+# Default download batching, sliced once at import
+BATCH_SIZE = 5
+BATCHES: tuple[tuple[str, ...], ...] = tuple(
+    DOW_30[i : i + BATCH_SIZE] for i in range(0, len(DOW_30), BATCH_SIZE)
+)
@@ -1,18 +1,20 @@
 # functional/utils/data_loading.py
 from pathlib import Path
 from datetime import datetime
+import argparse
+import logging
 import time, random
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import yfinance as yf
 import pandas as pd
 from yfinance.exceptions import YFRateLimitError
 
-# --------- constants ---------
-DOW_30 = [
-    "MSFT","AAPL","NVDA","AMZN","WMT","JPM","V","HD","PG","JNJ",
-    "UNH","KO","CRM","CVX","CSCO","IBM","MCD","AXP","MRK","DIS",
-    "VZ","GS","CAT","BA","AMGN","HON","NKE","SHW","MMM","TRV",
-]
+from constants import DOW_30, BATCH_SIZE, BATCHES
+
+log = logging.getLogger(__name__)
 
+# --------- constants ---------
 DATA_DIR = (
     Path(__file__).resolve()        
     .parents[1]                     
@@ -24,50 +26,117 @@ SIMULATION_DIR = DATA_DIR
 
 BACKTEST_DIR = DATA_DIR / "backtest"
 
+# Single wide Close panel (Python consumers); the F# loader still reads
+# the per‑ticker CSVs
+PANEL_FILE = "prices.parquet"
+
+CSV_BUFFER = 1 << 20  # 1 MiB write buffer for CSV output
+
+# Local cache of raw batch downloads, so repeated runs skip the network
+CACHE_DIR = Path(__file__).resolve().parent / ".yf_cache"
+CACHE_TTL = 6 * 3600  # seconds
+
 for directory in [SIMULATION_DIR, BACKTEST_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
 # --------- helpers ------------
-def _download_batch(tickers, start, end, interval, max_retries=5):
+def _cache_file(tickers, start, end, interval):
+    key = repr((tuple(sorted(tickers)), start, end, interval))
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.parquet"
+
+def _download_ticker(ticker, start, end, interval, max_retries=5):
+    # yf.Ticker keeps its state per instance; yf.download shares module-level
+    # globals across calls and is not safe to run from several threads
     for attempt in range(max_retries):
         try:
-            df = yf.download(
-                tickers=tickers,
+            history = yf.Ticker(ticker).history(
                 start=start,
                 end=end,
                 interval=interval,
-                group_by="ticker",
-                progress=False,
-                threads=False,
                 auto_adjust=False,
+                actions=False,
+                raise_errors=True,
             )
-            return df
         except YFRateLimitError:
             wait = 2 ** attempt + random.uniform(0, 1)
             print(f"Rate‑limited. Retry in {wait:.1f}s …")
             time.sleep(wait)
-    raise RuntimeError(f"Unable to fetch {tickers} after {max_retries} retries")
+            continue
+        close = history["Close"].rename(ticker)
+        if not interval.endswith(("m", "h")):   # naive dates, like yf.download
+            close.index = close.index.tz_localize(None)
+        return close
+    raise RuntimeError(f"Unable to fetch {ticker} after {max_retries} retries")
+
+def _download_batch(tickers, start, end, interval, max_retries=5):
+    cache = _cache_file(tickers, start, end, interval)
+    if cache.exists() and time.time() - cache.stat().st_mtime < CACHE_TTL:
+        closes = pd.read_parquet(cache, engine="pyarrow")
+        return {tkr: closes[tkr] for tkr in tickers}
+
+    # keep only Close: {ticker: series}
+    closes = {tkr: _download_ticker(tkr, start, end, interval, max_retries) for tkr in tickers}
+    CACHE_DIR.mkdir(exist_ok=True)
+    pd.DataFrame(closes).to_parquet(cache, compression="zstd")
+    return closes
+
+def fetch_dow30(start, end, output_dir, interval="1d", batch_size=BATCH_SIZE, max_workers=6,
+                write_csv=True, write_workers=4) -> None:
+    """Download Dow‑30 history, save the Close panel to parquet and, if
+    ``write_csv``, dump each Close series to CSV (needed by the F# loader).
+
+    Batches are fetched concurrently (``max_workers`` threads), one
+    ``yf.Ticker`` per symbol; each download keeps its own rate‑limit backoff
+    inside ``_download_ticker``. The CSVs
+    are written by ``write_workers`` threads.
+    """
+    def _fetch(batch):
+        return _download_batch(batch, start, end, interval)
+
+    batches = BATCHES if batch_size == BATCH_SIZE else tuple(
+        DOW_30[i : i + batch_size] for i in range(0, len(DOW_30), batch_size)
+    )
 
-def fetch_dow30(start, end, output_dir, interval="1d", batch_size=5) -> None:
-    """Download Dow‑30 history and dump each Close series to CSV."""
-    dfs = []
-    for i in range(0, len(DOW_30), batch_size):
-        batch = DOW_30[i : i + batch_size]
-        dfs.append(_download_batch(batch, start, end, interval))
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, batch): i for i, batch in enumerate(batches)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    all_closes = {}
+    for i in sorted(results):                  # keep DOW_30 order
+        all_closes.update(results[i])
 
-    panel = pd.concat(dfs, axis=1).loc[:, pd.IndexSlice[:, "Close"]]
-    panel.columns = panel.columns.get_level_values(0)
+    panel = pd.DataFrame(all_closes)
 
-    for tkr in panel:
+    panel.to_parquet(output_dir / PANEL_FILE, compression="zstd")
+    print(f"Saved {output_dir / PANEL_FILE}")
+
+    if not write_csv:
+        return
+
+    def _write_csv(tkr):
         outfile = output_dir / f"{tkr}.csv"
-        panel[[tkr]].dropna().to_csv(outfile)
-        print(f"Saved {outfile.relative_to(DATA_DIR.parent.parent)}")  # neat log
+        with open(outfile, "wb", buffering=CSV_BUFFER) as f:
+            panel[[tkr]].dropna().to_csv(f, chunksize=50_000)
+        log.debug("Saved %s", outfile)
+        return outfile.name
+
+    with ThreadPoolExecutor(max_workers=write_workers) as executor:
+        saved = list(executor.map(_write_csv, panel.columns))
+    print(f"Saved {len(saved)} files to {output_dir}: {', '.join(saved)}")
 
 # --------- CLI usage ----------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download Dow‑30 Close prices.")
+    parser.add_argument(
+        "--parquet-only", action="store_true",
+        help=f"write only {PANEL_FILE}, skipping the per‑ticker CSVs used by F#",
+    )
+    args = parser.parse_args()
+
     # Download 2024 data (Aug-Dec) for simulation
     print("\nDownloading 2024 data (Aug-Dec) for simulation...")
-    fetch_dow30("2024-08-01", "2024-12-31", SIMULATION_DIR)
+    fetch_dow30("2024-08-01", "2024-12-31", SIMULATION_DIR, write_csv=not args.parquet_only)
 
     print("\nDownloading 2025 data (Jan-Mar) for backtest...")
-    fetch_dow30("2025-01-01", "2025-03-31", BACKTEST_DIR)
+    fetch_dow30("2025-01-01", "2025-03-31", BACKTEST_DIR, write_csv=not args.parquet_only)
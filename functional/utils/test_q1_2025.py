@@ -7,69 +7,125 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import math
 import sys
 
+try:
+    import pyarrow.csv as pacsv                          # leitor CSV mais rápido
+except ImportError:
+    pacsv = None
+
 # ----------------------------------------------------------------
 # CONFIGURAÇÃO – ajuste se seus caminhos forem diferentes
 PORTFOLIO_CSV   = Path("../src/portfolio_results.csv")   # carteira “ótima”
 BACKTEST_DIR    = Path("../src/data/backtest")           # CSVs de 2025‑Q1
+PRICES_PARQUET  = BACKTEST_DIR / "prices.parquet"        # painel único (data_loading.py)
 OUTPUT_CSV      = Path("backtesting_results.csv")        # sai aqui
 
 PERIOD_START    = "2025-01-01"
 PERIOD_END      = "2025-03-31"
 
+PRICE_DTYPE     = np.float32                             # preços (métricas em float64)
+
 # ----------------------------------------------------------------
+def make_metric_fn(returns: pd.DataFrame):
+    """
+    Pré‑calcula média e covariância anualizadas de `returns` uma única vez
+    e devolve f(weights) -> (retorno, volatilidade, Sharpe) anualizados.
+    Útil para avaliar muitas carteiras (p.ex. bootstrap) nos mesmos dados.
+    """
+    R   = returns.to_numpy(dtype=np.float64, copy=False)  # sem alinhamento de rótulos
+    mu  = R.mean(axis=0) * 252
+    cov = np.cov(R, rowvar=False, ddof=1) * 252
+
+    def metric(weights: np.ndarray):
+        port_ret = float(mu @ weights)                         # retorno
+        port_vol = math.sqrt(float(weights @ cov @ weights))   # vol
+        sharpe   = port_ret / port_vol if port_vol != 0 else np.nan
+        return port_ret, port_vol, sharpe
+
+    return metric
+
 def calculate_portfolio_metrics(returns: pd.DataFrame, weights: np.ndarray):
     """
     Retorno anualizado, volatilidade anualizada e Sharpe ratio.
     """
-    port_ret = np.sum(returns.mean() * weights) * 252      # retorno
-    port_vol = np.sqrt(weights.T @ (returns.cov() * 252) @ weights)  # vol
-    sharpe   = port_ret / port_vol if port_vol != 0 else np.nan
-    return port_ret, port_vol, sharpe
+    return make_metric_fn(returns)(weights)
+
+# ----------------------------------------------------------------
+def _read_ticker_csv(fp: Path) -> pd.Series:
+    """Série de preços de um CSV ['Date', <ticker>] (igual ao DataLoader)."""
+    if pacsv is not None:
+        df = pacsv.read_csv(fp).to_pandas(
+            date_as_object=False, split_blocks=True, self_destruct=True
+        )
+        return df.set_index("Date").iloc[:, 0].astype(PRICE_DTYPE)
+
+    # lê só o cabeçalho para achar a coluna de preço, depois só o necessário
+    price_col = next(c for c in pd.read_csv(fp, nrows=0).columns if c != "Date")
+    return pd.read_csv(
+        fp,
+        usecols=["Date", price_col],
+        parse_dates=["Date"],
+        index_col="Date",
+        dtype={price_col: PRICE_DTYPE},
+        engine="c",
+    )[price_col]
+
+def load_backtest_prices(tickers) -> pd.DataFrame:
+    """
+    Preços de fechamento (uma coluna por ticker) dos ativos disponíveis.
+    Usa o painel parquet se existir; senão lê os CSVs por ticker.
+    """
+    if PRICES_PARQUET.exists():
+        panel = pd.read_parquet(PRICES_PARQUET, engine="pyarrow")
+        return panel[[t for t in tickers if t in panel.columns]].astype(PRICE_DTYPE)
+
+    frames = {
+        tkr: _read_ticker_csv(fp)
+        for tkr in tickers
+        if (fp := BACKTEST_DIR / f"{tkr}.csv").exists()
+    }
+    if not frames:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="Date"))
+    return pd.concat(frames, axis=1)             # um único alinhamento por data
 
 # ----------------------------------------------------------------
 def main():
     if not PORTFOLIO_CSV.exists():
         sys.exit(f"❌ Arquivo {PORTFOLIO_CSV} não encontrado")
 
-    best = pd.read_csv(PORTFOLIO_CSV).iloc[0]
+    # só a 1ª linha (melhor carteira) – o arquivo completo tem ~90 MB
+    best = pd.read_csv(PORTFOLIO_CSV, nrows=1).iloc[0]
 
     # -------- parse tickers & pesos (corrige vírgula decimal) ----
     tickers = best["Tickers"].split('-')
-    weights = np.array([
-        float(w.replace(',', '.'))  # garante . como separador decimal
-        for w in best["Weights"].split('-')
-    ])
+    w_strs  = best["Weights"].split('-')
+    weights = np.fromiter(
+        (float(w.replace(',', '.')) for w in w_strs),  # garante . como separador decimal
+        dtype=np.float64,
+        count=len(w_strs),
+    )
 
     # -------- lê preços de Q1‑2025 --------------------------------
     good_tickers = []
     good_weights = []
-    price_series = []
+
+    available = load_backtest_prices(tickers).loc[PERIOD_START:PERIOD_END]
+    prices    = available.dropna(axis=1, how="all")   # descarta séries vazias
 
     for tkr, w in zip(tickers, weights):
-        fp = BACKTEST_DIR / f"{tkr}.csv"
-        if not fp.exists():
-            print(f"[WARN] dados de {tkr} ausentes em {fp}, removendo da carteira")
+        if tkr not in available.columns:
+            print(f"[WARN] dados de {tkr} ausentes em {BACKTEST_DIR}, removendo da carteira")
             continue
 
-        df = pd.read_csv(fp)
-        # supõe colunas ['Date', <ticker>]  (igual ao DataLoader)
-        price_col = [c for c in df.columns if c != "Date"][0]
-        ser = (
-            df.assign(Date=pd.to_datetime(df["Date"]))
-              .set_index("Date")[price_col]
-              .loc[PERIOD_START:PERIOD_END]
-        )
-
         # apenas se houver dados suficientes
-        if ser.empty or ser.isna().all():
+        if tkr not in prices.columns:
             print(f"[WARN] série vazia para {tkr} em Q1‑2025, removendo")
             continue
 
         good_tickers.append(tkr)
         good_weights.append(w)
-        price_series.append(ser)
 
     if not good_tickers:
         sys.exit("❌ Nenhum ativo com dados válidos para Q1‑2025.")
@@ -79,12 +135,12 @@ def main():
     good_weights = good_weights / good_weights.sum()
 
     # -------- monta DataFrame combinado e calcula retornos --------
-    combined = pd.concat(price_series, axis=1)
-    combined.columns = good_tickers              # garante mesma ordem
+    combined = prices[good_tickers]              # garante mesma ordem
     returns  = combined.pct_change().dropna()
 
     # -------- métricas Q1‑2025 ------------------------------------
-    q1_ret, q1_vol, q1_sharpe = calculate_portfolio_metrics(returns, good_weights)
+    metric = make_metric_fn(returns)
+    q1_ret, q1_vol, q1_sharpe = metric(good_weights)
 
     # -------- print comparativo -----------------------------------
     print("\n🔎  Q1‑2025 Performance:")
@@ -19,6 +19,7 @@ pio.renderers.default = 'browser'
 
 # Import Optifolio modules
 from src import DataLoader, PortfolioSimulator, PortfolioMetrics, DataViz
+from src.constants import DOW_30
 
 def main():
     """Main function to demonstrate Optifolio functionality."""
@@ -27,11 +28,7 @@ def main():
     print("1. Loading Stock Data...")
     
     # Define parameters
-    tickers = [
-        'MSFT', 'AAPL', 'NVDA', 'AMZN', 'WMT', 'JPM', 'V', 'HD', 'PG', 'JNJ',
-        'UNH', 'KO', 'CRM', 'CVX', 'CSCO', 'IBM', 'MCD', 'AXP', 'MRK', 'DIS',
-        'VZ', 'GS', 'CAT', 'BA', 'AMGN', 'HON', 'NKE', 'SHW', 'MMM', 'TRV'
-    ]
+    tickers = DOW_30
 
     # Calculate date range (last 5 years)
     end_date = datetime(2024, 12, 31).strftime('%Y-%m-%d')
@@ -7,12 +7,14 @@ and visualizing the results.
 
 from .data_loader import DataLoader
 from .simulate import PortfolioSimulator
-from .utils import PortfolioMetrics
+from .utils import Metrics, PortfolioMetrics, RollingSharpe
 from .data_viz import DataViz
 
 __all__ = [
     'DataLoader',
     'PortfolioSimulator',
     'PortfolioMetrics',
+    'Metrics',
+    'RollingSharpe',
     'DataViz'
 ]
@@ -0,0 +1,44 @@
+"""
+Optional Numba support.
+
+Exposes ``njit``, ``prange``, ``set_num_threads`` and the shared ``FASTMATH``
+flag set. When Numba is not installed, ``njit`` returns the decorated function
+unchanged, ``prange`` is the builtin ``range`` and ``set_num_threads`` does
+nothing, so modules can define kernels unconditionally and check
+``NUMBA_AVAILABLE`` to pick a NumPy path instead.
+"""
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for ``numba.njit``, with or without arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# fastmath without nnan/ninf, so NaN returns (e.g. around price gaps)
+# propagate to the metrics instead of being assumed away
+FASTMATH = {"reassoc", "contract", "arcp", "nsz", "afn"}
+
+
+def set_num_threads(n: int):
+    """
+    Limit the threads used by parallel Numba kernels.
+
+    Args:
+        n (int): Requested number of threads, clamped to what Numba allows.
+    """
+    if NUMBA_AVAILABLE:
+        numba.set_num_threads(max(1, min(n, numba.config.NUMBA_NUM_THREADS)))
+
+__all__ = ['njit', 'prange', 'set_num_threads', 'FASTMATH', 'NUMBA_AVAILABLE']
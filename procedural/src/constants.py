@@ -0,0 +1,12 @@
+"""
+Shared constants for Optifolio.
+"""
+
+from typing import Tuple
+
+# Dow Jones Industrial Average constituents
+DOW_30: Tuple[str, ...] = (
+    'MSFT', 'AAPL', 'NVDA', 'AMZN', 'WMT', 'JPM', 'V', 'HD', 'PG', 'JNJ',
+    'UNH', 'KO', 'CRM', 'CVX', 'CSCO', 'IBM', 'MCD', 'AXP', 'MRK', 'DIS',
+    'VZ', 'GS', 'CAT', 'BA', 'AMGN', 'HON', 'NKE', 'SHW', 'MMM', 'TRV'
+)
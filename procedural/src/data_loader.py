@@ -1,11 +1,67 @@
+import asyncio
+import hashlib
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 import time
 import random
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from yfinance.exceptions import YFRateLimitError
 
+try:
+    import pyarrow.csv as pacsv
+except ImportError:  # pandas-only fallback
+    pacsv = None
+
+# Yahoo Finance chart endpoint used by the asyncio fetcher
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# Write buffer and rows per chunk for CSV output
+CSV_BUFFER_SIZE = 1 << 20
+CSV_CHUNKSIZE = 50_000
+
+
+def _read_dated_csv(filename: str, dtype: np.dtype) -> pd.DataFrame:
+    """
+    Read a CSV indexed by its first (date) column.
+
+    Uses the multi-threaded pyarrow CSV reader when available and falls back
+    to pandas otherwise. Either way the values are cast to ``dtype`` and the
+    dates to microseconds, the same dtypes the Parquet loaders return.
+
+    Args:
+        filename (str): Path to the CSV file.
+        dtype (np.dtype): Floating point type of the values.
+
+    Returns:
+        pd.DataFrame: DataFrame indexed by date.
+    """
+    if pacsv is None:
+        df = pd.read_csv(filename, index_col=0, parse_dates=True)
+    else:
+        table = pacsv.read_csv(filename)
+        df = table.to_pandas(date_as_object=False, split_blocks=True, self_destruct=True)
+        df = df.set_index(df.columns[0])
+
+    # pyarrow parses dates to milliseconds
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = df.index.as_unit("us")
+    return df.astype(dtype, copy=False)
+
+
+def _write_csv(df: pd.DataFrame, filename: str):
+    """
+    Write a DataFrame to CSV through a large buffered file handle.
+
+    Args:
+        df (pd.DataFrame): DataFrame to save.
+        filename (str): Path to save the CSV file.
+    """
+    with open(filename, "wb", buffering=CSV_BUFFER_SIZE) as f:
+        df.to_csv(f, chunksize=CSV_CHUNKSIZE)
+
 class DataLoader:
     """
     Object to load stock data from Yahoo Finance.
@@ -15,96 +71,288 @@ class DataLoader:
         start_date (str): Start date to load data from.
         end_date (str): End date to load data to.
         interval (str): Interval to load data at.
+        cache_dir (Optional[str]): Directory for cached downloads (None disables caching).
+        cache_ttl (Optional[float]): Seconds a cached download stays valid (None never expires).
+        dtype (np.dtype): Floating point type of the prices and returns.
         prices_df (Optional[pd.DataFrame]): DataFrame containing adjusted close prices.
         returns_df (Optional[pd.DataFrame]): DataFrame containing daily returns.
     """
 
-    def __init__(self, tickers: List[str], start_date: str, end_date: str, interval: str):
+    def __init__(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        interval: str,
+        cache_dir: Optional[str] = ".optifolio_cache",
+        cache_ttl: Optional[float] = None,
+        dtype: np.dtype = np.float32
+    ):
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
         self.interval = interval
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.dtype = dtype
         self.prices_df = None
         self.returns_df = None
 
-    def _download_batch(self, batch_tickers: List[str], max_retries: int = 5) -> pd.DataFrame:
+    def _cache_path(self) -> Optional[Path]:
         """
-        Download a batch of tickers with retry logic for rate limiting.
+        Path of the Parquet cache file for the current request.
+
+        The file name is a hash of (tickers, start_date, end_date, interval), so
+        any change to the request maps to a different file. Files hold the raw
+        float64 download and are cast to ``dtype`` on load, so loaders with
+        different dtypes can share them.
+
+        Returns:
+            Optional[Path]: Cache file path, or None if caching is disabled.
+        """
+        if self.cache_dir is None:
+            return None
+
+        # "float64" marks the raw-precision layout, so older float32 files are not reused
+        key = repr((tuple(sorted(self.tickers)), self.start_date, self.end_date, self.interval, "float64"))
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return Path(self.cache_dir) / f"{digest}.parquet"
+
+    def _load_cache(self, cache_file: Optional[Path]) -> bool:
+        """
+        Load prices from the cache file if it exists and has not expired.
 
         Args:
-            batch_tickers (List[str]): List of tickers to download
+            cache_file (Optional[Path]): Cache file path from ``_cache_path``.
+
+        Returns:
+            bool: True if ``prices_df`` was loaded from the cache.
+        """
+        if cache_file is None or not cache_file.exists():
+            return False
+        if self.cache_ttl is not None and time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+            return False
+
+        prices_df = pd.read_parquet(cache_file, engine="pyarrow")
+
+        # The key ignores ticker order, so return the columns in the order
+        # requested here; a file missing some of them is treated as a miss
+        tickers = list(self.tickers)
+        if not set(tickers).issubset(prices_df.columns):
+            return False
+        self.prices_df = prices_df[tickers].astype(self.dtype)
+        print(f"Loaded cached data from {cache_file}")
+        return True
+
+    def _download_ticker(self, ticker: str, max_retries: int = 5) -> pd.Series:
+        """
+        Download the Close series of one ticker with retry logic for rate limiting.
+
+        Uses ``yf.Ticker(...).history``, which keeps its state per instance.
+        ``yf.download`` resets and reads module-level globals on every call, so
+        concurrent calls from the thread pool would overwrite each other's results.
+
+        Args:
+            ticker (str): Ticker to download
             max_retries (int): Maximum number of retry attempts
 
         Returns:
-            pd.DataFrame: DataFrame containing the downloaded data
+            pd.Series: Close prices indexed by date
         """
         for attempt in range(max_retries):
             try:
-                df = yf.download(
-                    tickers=batch_tickers,
+                history = yf.Ticker(ticker).history(
                     start=self.start_date,
                     end=self.end_date,
                     interval=self.interval,
-                    group_by="ticker",
-                    progress=False,
-                    threads=False,
                     auto_adjust=False,
+                    actions=False,
+                    raise_errors=True,
                 )
-                return df
             except YFRateLimitError:
                 wait = 2 ** attempt + random.uniform(0, 1)
                 print(f"Rate‑limited. Retry in {wait:.1f}s …")
                 time.sleep(wait)
-        raise RuntimeError(f"Unable to fetch {batch_tickers} after {max_retries} retries")
+                continue
+
+            close = history["Close"].rename(ticker)
+            # Match yf.download, which drops the timezone of daily and longer bars
+            if not self.interval.endswith(("m", "h")):
+                close.index = close.index.tz_localize(None)
+            return close
+        raise RuntimeError(f"Unable to fetch {ticker} after {max_retries} retries")
 
-    def fetch_data(self, batch_size: int = 5) -> pd.DataFrame:
+    def _download_batch(self, batch_tickers: List[str], max_retries: int = 5) -> Dict[str, pd.Series]:
+        """
+        Download a batch of tickers with retry logic for rate limiting.
+
+        Args:
+            batch_tickers (List[str]): List of tickers to download
+            max_retries (int): Maximum number of retry attempts per ticker
+
+        Returns:
+            Dict[str, pd.Series]: Close price series keyed by ticker
+        """
+        return {ticker: self._download_ticker(ticker, max_retries) for ticker in batch_tickers}
+
+    def fetch_data(self, batch_size: int = 5, max_workers: int = 6) -> pd.DataFrame:
         """
         Fetch stock data from Yahoo Finance with improved rate limiting and error handling.
 
+        Batches are downloaded concurrently in a thread pool; each worker retries
+        independently on rate limiting. A complete download is cached to Parquet
+        and reused by later calls with the same tickers, dates and interval until it
+        is older than ``cache_ttl``.
+
         Args:
             batch_size (int): Number of tickers to fetch in each batch.
+            max_workers (int): Number of batches to download concurrently.
 
         Returns:
             pd.DataFrame: DataFrame containing stock data.
         """
-        all_data = []
-        
-        # Process tickers in batches
-        for i in range(0, len(self.tickers), batch_size):
-            batch_tickers = self.tickers[i:i + batch_size]
-            print(f"Fetching data for tickers: {batch_tickers}")
-            
-            try:
-                # Download data for the current batch
-                batch_data = self._download_batch(batch_tickers)
-                all_data.append(batch_data)
-                    
-            except Exception as e:
-                print(f"Error fetching data for batch {batch_tickers}: {str(e)}")
-                continue
+        # Serve from the on-disk cache when available
+        cache_file = self._cache_path()
+        if self._load_cache(cache_file):
+            return self.prices_df
+
+        batches = [
+            self.tickers[i:i + batch_size]
+            for i in range(0, len(self.tickers), batch_size)
+        ]
+        results = {}
+
+        # Process batches in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, batch_tickers in enumerate(batches):
+                print(f"Fetching data for tickers: {batch_tickers}")
+                futures[executor.submit(self._download_batch, batch_tickers)] = i
+
+            for future in as_completed(futures):
+                batch_tickers = batches[futures[future]]
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"Error fetching data for batch {batch_tickers}: {str(e)}")
+
+        # Keep the original ticker order regardless of completion order
+        all_closes = {}
+        for i in sorted(results):
+            all_closes.update(results[i])
         
-        # Combine all batches
-        if all_data:
-            combined_data = pd.concat(all_data, axis=1)
-            # Extract Close prices and flatten multi-level columns
-            self.prices_df = combined_data.loc[:, pd.IndexSlice[:, "Close"]]
-            self.prices_df.columns = self.prices_df.columns.get_level_values(0)
+        # Assemble the Close series directly into one frame
+        if all_closes:
+            prices_df = pd.DataFrame(all_closes)
+
+            # Only cache complete downloads so failed batches are retried next run.
+            # The cache keeps the download's own precision; loaders cast on read.
+            if cache_file is not None and len(results) == len(batches):
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                prices_df.to_parquet(cache_file, compression="zstd")
+            self.prices_df = prices_df.astype(self.dtype)
             return self.prices_df
         else:
             raise ValueError("No data was successfully fetched")
 
+    async def _fetch_one_async(self, session, ticker: str, max_retries: int = 5) -> pd.Series:
+        """
+        Download the Close series of one ticker from the chart endpoint.
+
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session.
+            ticker (str): Ticker to download.
+            max_retries (int): Maximum number of retry attempts
+
+        Returns:
+            pd.Series: Close prices indexed by date.
+        """
+        params = {
+            "period1": int(pd.Timestamp(self.start_date).timestamp()),
+            "period2": int(pd.Timestamp(self.end_date).timestamp()),
+            "interval": self.interval,
+            "events": "",
+        }
+        for attempt in range(max_retries):
+            async with session.get(CHART_URL.format(ticker=ticker), params=params) as resp:
+                if resp.status == 429:
+                    wait = 2 ** attempt + random.uniform(0, 1)
+                    print(f"Rate‑limited on {ticker}. Retry in {wait:.1f}s …")
+                    await asyncio.sleep(wait)
+                    continue
+                resp.raise_for_status()
+                payload = await resp.json()
+
+            result = payload["chart"]["result"][0]
+            # Timestamps are session opens in UTC; map them to exchange-local dates
+            dates = (
+                pd.to_datetime(result["timestamp"], unit="s", utc=True)
+                .tz_convert(result["meta"]["exchangeTimezoneName"])
+                .tz_localize(None)
+                .normalize()
+            )
+            close = result["indicators"]["quote"][0]["close"]
+            return pd.Series(close, index=dates.rename("Date"), name=ticker, dtype=np.float64)
+        raise RuntimeError(f"Unable to fetch {ticker} after {max_retries} retries")
+
+    async def fetch_async(self, max_connections: int = 8) -> pd.DataFrame:
+        """
+        Fetch Close prices for all tickers concurrently with asyncio and aiohttp.
+
+        Bypasses yfinance and issues one request per ticker on a single event
+        loop, e.g. ``asyncio.run(loader.fetch_async())``. Requires ``aiohttp``.
+
+        Args:
+            max_connections (int): Maximum number of simultaneous connections.
+
+        Returns:
+            pd.DataFrame: DataFrame containing stock data.
+        """
+        import aiohttp
+
+        cache_file = self._cache_path()
+        if self._load_cache(cache_file):
+            return self.prices_df
+
+        connector = aiohttp.TCPConnector(limit=max_connections)
+        headers = {"User-Agent": "Mozilla/5.0"}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            series = await asyncio.gather(
+                *[self._fetch_one_async(session, ticker) for ticker in self.tickers]
+            )
+
+        prices_df = pd.concat(series, axis=1)
+
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            prices_df.to_parquet(cache_file, compression="zstd")
+        self.prices_df = prices_df.astype(self.dtype)
+        return self.prices_df
+
     def compute_daily_returns(self) -> pd.DataFrame:
         """
         Compute daily returns from adjusted close prices.
 
+        The first date has no previous price and is dropped.
+
         Returns:
             pd.DataFrame: DataFrame containing daily returns.
         """
         if self.prices_df is None:
             raise ValueError("No price data available. Call fetch_data() first.")
         
-        # Calculate daily returns using Pandas
-        self.returns_df = self.prices_df.pct_change()
+        # Calculate daily returns directly on the price matrix: P[t] / P[t-1] - 1
+        prices = self.prices_df.to_numpy(dtype=self.dtype, copy=False)
+        returns = np.divide(prices[1:], prices[:-1])
+        returns -= 1.0
+
+        # Wrap the result without another copy (pandas 3 copies ndarrays by default)
+        self.returns_df = pd.DataFrame(
+            returns,
+            index=self.prices_df.index[1:],
+            columns=self.prices_df.columns,
+            copy=False
+        )
         return self.returns_df
 
     def save_prices_to_csv(self, filename: str):
@@ -117,7 +365,7 @@ class DataLoader:
         if self.prices_df is None:
             raise ValueError("No price data available. Call fetch_data() first.")
         
-        self.prices_df.to_csv(filename)
+        _write_csv(self.prices_df, filename)
         print(f"Price data saved to {filename}")
 
     def save_returns_to_csv(self, filename: str):
@@ -130,7 +378,7 @@ class DataLoader:
         if self.returns_df is None:
             raise ValueError("No returns data available. Call compute_daily_returns() first.")
         
-        self.returns_df.to_csv(filename)
+        _write_csv(self.returns_df, filename)
         print(f"Returns data saved to {filename}")
 
     def load_prices_from_csv(self, filename: str):
@@ -140,7 +388,7 @@ class DataLoader:
         Args:
             filename (str): Path to the CSV file.
         """
-        self.prices_df = pd.read_csv(filename, index_col=0, parse_dates=True)
+        self.prices_df = _read_dated_csv(filename, self.dtype)
         print(f"Price data loaded from {filename}")
 
     def load_returns_from_csv(self, filename: str):
@@ -150,10 +398,51 @@ class DataLoader:
         Args:
             filename (str): Path to the CSV file.
         """
-        self.returns_df = pd.read_csv(filename, index_col=0, parse_dates=True)
+        self.returns_df = _read_dated_csv(filename, self.dtype)
         print(f"Returns data loaded from {filename}")
-        
-        
-        
 
-        
+    def save_prices_to_parquet(self, filename: str):
+        """
+        Save adjusted close prices to a zstd-compressed Parquet file.
+
+        Args:
+            filename (str): Path to save the Parquet file.
+        """
+        if self.prices_df is None:
+            raise ValueError("No price data available. Call fetch_data() first.")
+
+        self.prices_df.to_parquet(filename, compression="zstd", write_statistics=True)
+        print(f"Price data saved to {filename}")
+
+    def save_returns_to_parquet(self, filename: str):
+        """
+        Save daily returns to a zstd-compressed Parquet file.
+
+        Args:
+            filename (str): Path to save the Parquet file.
+        """
+        if self.returns_df is None:
+            raise ValueError("No returns data available. Call compute_daily_returns() first.")
+
+        self.returns_df.to_parquet(filename, compression="zstd", write_statistics=True)
+        print(f"Returns data saved to {filename}")
+
+    def load_prices_from_parquet(self, filename: str):
+        """
+        Load adjusted close prices from a Parquet file.
+
+        Args:
+            filename (str): Path to the Parquet file.
+        """
+        self.prices_df = pd.read_parquet(filename, engine="pyarrow", memory_map=True).astype(self.dtype, copy=False)
+        print(f"Price data loaded from {filename}")
+
+    def load_returns_from_parquet(self, filename: str):
+        """
+        Load daily returns from a Parquet file.
+
+        Args:
+            filename (str): Path to the Parquet file.
+        """
+        self.returns_df = pd.read_parquet(filename, engine="pyarrow", memory_map=True).astype(self.dtype, copy=False)
+        print(f"Returns data loaded from {filename}")
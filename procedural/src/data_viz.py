@@ -4,6 +4,58 @@ import plotly.subplots as sp
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple
+from ._njit import njit
+
+
+@njit(cache=True)
+def _lttb_indices(y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of an evenly indexed series.
+
+    Keeps the first and last points and, for each of the ``n_out - 2`` buckets
+    in between, the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket.
+
+    Args:
+        y (np.ndarray): Series values, shape (n,).
+        n_out (int): Number of points to keep (at least 3 and less than n).
+
+    Returns:
+        np.ndarray: Sorted positions of the kept points, shape (n_out,).
+    """
+    n = y.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+
+    for i in range(n_out - 2):
+        # Mean of the next bucket
+        start = int((i + 1) * every) + 1
+        end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(start, end):
+            avg_x += j
+            avg_y += y[j]
+        avg_x /= end - start
+        avg_y /= end - start
+
+        # Point of the current bucket with the largest triangle
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        best = lo
+        best_area = -1.0
+        for j in range(lo, hi):
+            area = abs((a - avg_x) * (y[j] - y[a]) - (a - j) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        out[i + 1] = best
+        a = best
+
+    return out
 
 class DataViz:
     """
@@ -14,13 +66,38 @@ class DataViz:
     """
     
     @staticmethod
-    def plot_stock_prices(prices_df: pd.DataFrame, title: str = "Stock Prices Over Time") -> go.Figure:
+    def _downsample(x: np.ndarray, y: np.ndarray, max_points: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Downsample a trace with LTTB if it has more than ``max_points`` points.
+        
+        Args:
+            x (np.ndarray): Trace x values.
+            y (np.ndarray): Trace y values.
+            max_points (Optional[int]): Maximum number of points, ``None`` to disable.
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Downsampled x and y values.
+        """
+        if max_points is None or max_points < 3 or len(y) <= max_points:
+            return x, y
+        
+        keep = _lttb_indices(np.asarray(y, dtype=np.float64), max_points)
+        return x[keep], y[keep]
+    
+    @staticmethod
+    def plot_stock_prices(
+        prices_df: pd.DataFrame,
+        title: str = "Stock Prices Over Time",
+        max_points: Optional[int] = 2000
+    ) -> go.Figure:
         """
         Create a line plot of stock prices over time.
         
         Args:
             prices_df (pd.DataFrame): DataFrame containing stock prices.
             title (str): Title for the plot.
+            max_points (Optional[int]): Downsample longer traces to this many
+                points with LTTB. ``None`` keeps every point.
             
         Returns:
             go.Figure: Plotly figure object.
@@ -28,11 +105,16 @@ class DataViz:
         # Create figure
         fig = go.Figure()
         
+        # Convert the index and values once; each trace gets a column view
+        x = prices_df.index.to_numpy()
+        values = prices_df.to_numpy()
+        
         # Add traces for each stock
-        for column in prices_df.columns:
+        for i, column in enumerate(prices_df.columns):
+            trace_x, trace_y = DataViz._downsample(x, values[:, i], max_points)
             fig.add_trace(go.Scatter(
-                x=prices_df.index,
-                y=prices_df[column],
+                x=trace_x,
+                y=trace_y,
                 name=column,
                 mode='lines'
             ))
@@ -55,13 +137,19 @@ class DataViz:
         return fig
     
     @staticmethod
-    def plot_stock_returns(returns_df: pd.DataFrame, title: str = "Daily Returns") -> go.Figure:
+    def plot_stock_returns(
+        returns_df: pd.DataFrame,
+        title: str = "Daily Returns",
+        max_points: Optional[int] = 2000
+    ) -> go.Figure:
         """
         Create a line plot of daily returns.
         
         Args:
             returns_df (pd.DataFrame): DataFrame containing daily returns.
             title (str): Title for the plot.
+            max_points (Optional[int]): Downsample longer traces to this many
+                points with LTTB. ``None`` keeps every point.
             
         Returns:
             go.Figure: Plotly figure object.
@@ -69,11 +157,16 @@ class DataViz:
         # Create figure
         fig = go.Figure()
         
+        # Convert the index and values once; each trace gets a column view
+        x = returns_df.index.to_numpy()
+        values = returns_df.to_numpy()
+        
         # Add traces for each stock
-        for column in returns_df.columns:
+        for i, column in enumerate(returns_df.columns):
+            trace_x, trace_y = DataViz._downsample(x, values[:, i], max_points)
             fig.add_trace(go.Scatter(
-                x=returns_df.index,
-                y=returns_df[column],
+                x=trace_x,
+                y=trace_y,
                 name=column,
                 mode='lines'
             ))
@@ -110,10 +203,12 @@ class DataViz:
         # Create figure
         fig = go.Figure()
         
+        values = returns_df.to_numpy()
+        
         # Add traces for each stock
-        for column in returns_df.columns:
+        for i, column in enumerate(returns_df.columns):
             fig.add_trace(go.Histogram(
-                x=returns_df[column],
+                x=values[:, i],
                 name=column,
                 nbinsx=50,
                 opacity=0.7
@@ -148,14 +243,20 @@ class DataViz:
         Returns:
             go.Figure: Plotly figure object.
         """
-        # Calculate correlation matrix
-        corr_matrix = returns_df.corr()
+        # Calculate correlation matrix with NumPy/BLAS; pandas' pairwise
+        # computation is only needed when some returns are missing
+        values = returns_df.to_numpy()
+        if np.isnan(values).any():
+            corr_matrix = returns_df.corr().to_numpy()
+        else:
+            corr_matrix = np.corrcoef(values, rowvar=False)
+        labels = returns_df.columns.tolist()
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
             z=corr_matrix,
-            x=corr_matrix.columns,
-            y=corr_matrix.columns,
+            x=labels,
+            y=labels,
             colorscale='RdBu',
             zmid=0,
             text=np.round(corr_matrix, 2),
@@ -194,25 +295,22 @@ class DataViz:
         Returns:
             go.Figure: Plotly figure object.
         """
-        # Select only the tickers in the portfolio
-        portfolio_returns = returns_df[tickers]
-        
-        # Convert to numpy for calculations
-        returns_array = portfolio_returns.values
-        weights_array = np.array(weights)
+        # Convert only the tickers in the portfolio to numpy
+        returns_array = returns_df[tickers].to_numpy()
+        weights_array = np.asarray(weights)
         
         # Calculate portfolio returns
         portfolio_returns = returns_array.dot(weights_array)
         
-        # Calculate cumulative returns
-        cumulative_returns = (1 + portfolio_returns).cumprod()
+        # Calculate cumulative returns as the exponential of summed log returns
+        cumulative_returns = np.exp(np.log1p(portfolio_returns).cumsum())
         
         # Create figure
         fig = go.Figure()
         
         # Add trace for portfolio
         fig.add_trace(go.Scatter(
-            x=returns_df.index,
+            x=returns_df.index.to_numpy(),
             y=cumulative_returns,
             name="Portfolio",
             mode='lines',
@@ -390,25 +488,25 @@ class DataViz:
         # Create figure
         fig = go.Figure()
         
+        # Weight matrix over the union of all tickers, zero where a portfolio
+        # does not hold a ticker
+        all_tickers = list(dict.fromkeys(t for _, tickers in portfolios.values() for t in tickers))
+        col_ix = {ticker: i for i, ticker in enumerate(all_tickers)}
+        weights_matrix = np.zeros((len(portfolios), len(all_tickers)))
+        for p, (weights, tickers) in enumerate(portfolios.values()):
+            weights_matrix[p, [col_ix[t] for t in tickers]] = weights
+        
+        # Calculate the returns and cumulative returns (summed log returns) of
+        # all portfolios at once
+        portfolio_returns = returns_df[all_tickers].to_numpy() @ weights_matrix.T
+        cumulative_returns = np.exp(np.log1p(portfolio_returns).cumsum(axis=0))
+        
         # Add trace for each portfolio
-        for name, (weights, tickers) in portfolios.items():
-            # Select only the tickers in the portfolio
-            portfolio_returns = returns_df[tickers]
-            
-            # Convert to numpy for calculations
-            returns_array = portfolio_returns.values
-            weights_array = np.array(weights)
-            
-            # Calculate portfolio returns
-            portfolio_returns = returns_array.dot(weights_array)
-            
-            # Calculate cumulative returns
-            cumulative_returns = (1 + portfolio_returns).cumprod()
-            
-            # Add trace
+        x = returns_df.index.to_numpy()
+        for p, name in enumerate(portfolios):
             fig.add_trace(go.Scatter(
-                x=returns_df.index,
-                y=cumulative_returns,
+                x=x,
+                y=cumulative_returns[:, p],
                 name=name,
                 mode='lines'
             ))
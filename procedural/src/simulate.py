@@ -1,9 +1,214 @@
 import itertools
+import os
+from collections import deque
 import numpy as np
 import pandas as pd
-from typing import List, Tuple, Optional, Dict, Any
-from joblib import Parallel, delayed
-from .utils import PortfolioMetrics
+from typing import List, Tuple, Optional, Dict, Any, Union, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from ._njit import njit, prange, set_num_threads, FASTMATH, NUMBA_AVAILABLE
+
+try:
+    from scipy.optimize import minimize
+except ImportError:  # constrained combinations fall back to Monte-Carlo
+    minimize = None
+
+# Number of trading days used to annualize daily metrics
+TRADING_DAYS = 252
+
+
+def _new_rng() -> np.random.Generator:
+    """
+    Create a freshly seeded random generator for the current process.
+
+    Returns:
+        np.random.Generator: PCG64DXSM generator seeded from OS entropy and the pid.
+    """
+    return np.random.Generator(np.random.PCG64DXSM(np.random.SeedSequence(spawn_key=(os.getpid(),))))
+
+
+# Weight sampler of this process; pool workers replace it in _init_worker so
+# forked processes do not share the parent's stream
+_rng = _new_rng()
+
+
+@njit(fastmath=FASTMATH, cache=True)
+def _simulate_combo(mu, cov, columns, num_simulations, risk_free_rate, max_weight):
+    """
+    Monte-Carlo search for the best Sharpe ratio of one combination.
+
+    Each simulation draws Dirichlet(1, ..., 1) weights (normalized exponentials),
+    applies the max weight cap, and computes the annualized metrics from the
+    mean vector and covariance matrix of the combination. NaN Sharpe ratios
+    rank below every valid draw, so a combination only reports NaN metrics
+    when none of its draws is valid (or there are no draws).
+
+    Args:
+        mu (np.ndarray): Mean daily return of all tickers, shape (n_tickers,).
+        cov (np.ndarray): Covariance of daily returns, shape (n_tickers, n_tickers).
+        columns (np.ndarray): Column indices of the combination, shape (k,).
+        num_simulations (int): Number of weight vectors to draw.
+        risk_free_rate (float): Annual risk-free rate.
+        max_weight (float): Maximum weight for each ticker.
+
+    Returns:
+        Tuple[np.ndarray, float, float, float]: Best weights, Sharpe ratio,
+        annualized return and annualized volatility.
+    """
+    k = columns.shape[0]
+    raw = np.empty(k)
+    w = np.empty(k, dtype=mu.dtype)
+    capped = np.empty(k, dtype=np.bool_)
+    best_weights = np.full(k, 1.0 / k, dtype=mu.dtype)
+    best_score = -np.inf
+    best_sharpe = np.nan
+    best_return = np.nan
+    best_volatility = np.nan
+
+    # Moments of the combination, gathered once
+    mu_c = np.empty(k, dtype=mu.dtype)
+    cov_c = np.empty((k, k), dtype=cov.dtype)
+    for i in range(k):
+        mu_c[i] = mu[columns[i]]
+        for j in range(k):
+            cov_c[i, j] = cov[columns[i], columns[j]]
+
+    for s in range(num_simulations):
+        # Dirichlet(1, ..., 1) sample
+        total = 0.0
+        for j in range(k):
+            raw[j] = -np.log(1.0 - np.random.random())
+            total += raw[j]
+        for j in range(k):
+            raw[j] /= total
+
+        # Cap weights and share the remaining budget proportionally
+        # (same rule as PortfolioSimulator._apply_max_weight_constraint)
+        if max_weight < 1.0:
+            if max_weight * k <= 1.0:
+                for j in range(k):
+                    w[j] = 1.0 / k
+            else:
+                for j in range(k):
+                    capped[j] = False
+                    w[j] = raw[j]
+                for _ in range(k):
+                    changed = False
+                    for j in range(k):
+                        if not capped[j] and w[j] > max_weight:
+                            capped[j] = True
+                            changed = True
+                    if not changed:
+                        break
+                    n_capped = 0
+                    uncapped_sum = 0.0
+                    for j in range(k):
+                        if capped[j]:
+                            n_capped += 1
+                        else:
+                            uncapped_sum += raw[j]
+                    scale = (1.0 - max_weight * n_capped) / uncapped_sum
+                    for j in range(k):
+                        w[j] = max_weight if capped[j] else raw[j] * scale
+        else:
+            for j in range(k):
+                w[j] = raw[j]
+
+        # Portfolio mean (mu'w) and variance (w'Cov w)
+        mean = 0.0
+        var = 0.0
+        for i in range(k):
+            mean += mu_c[i] * w[i]
+            row = 0.0
+            for j in range(k):
+                row += cov_c[i, j] * w[j]
+            var += w[i] * row
+        if var < 0.0:  # rounding; NaN passes through
+            var = 0.0
+        volatility = np.sqrt(var * TRADING_DAYS)
+        annualized_return = mean * TRADING_DAYS
+        sharpe_ratio = 0.0 if volatility == 0.0 else (annualized_return - risk_free_rate) / volatility
+
+        # Rank NaN as -inf; the first draw is always kept
+        score = sharpe_ratio if sharpe_ratio == sharpe_ratio else -np.inf
+        if s == 0 or score > best_score:
+            best_score = score
+            best_sharpe = sharpe_ratio
+            best_return = annualized_return
+            best_volatility = volatility
+            best_weights[:] = w
+
+    return best_weights, best_sharpe, best_return, best_volatility
+
+
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def _simulate_kernel(mu, cov, combos, num_simulations, risk_free_rate, max_weight):
+    """
+    Run ``_simulate_combo`` for a batch of combinations in parallel.
+
+    Args:
+        mu (np.ndarray): Mean daily return of all tickers, shape (n_tickers,).
+        cov (np.ndarray): Covariance of daily returns, shape (n_tickers, n_tickers).
+        combos (np.ndarray): Column indices of each combination, shape (n_combos, k).
+        num_simulations (int): Number of weight vectors to draw per combination.
+        risk_free_rate (float): Annual risk-free rate.
+        max_weight (float): Maximum weight for each ticker.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Best weights
+        (n_combos, k), Sharpe ratios, annualized returns and annualized
+        volatilities (n_combos,).
+    """
+    n_combos, k = combos.shape
+    best_weights = np.empty((n_combos, k), dtype=mu.dtype)
+    best_sharpe = np.empty(n_combos)
+    best_return = np.empty(n_combos)
+    best_volatility = np.empty(n_combos)
+
+    for c in prange(n_combos):
+        w, sharpe_ratio, annualized_return, volatility = _simulate_combo(
+            mu, cov, combos[c], num_simulations, risk_free_rate, max_weight
+        )
+        best_weights[c] = w
+        best_sharpe[c] = sharpe_ratio
+        best_return[c] = annualized_return
+        best_volatility[c] = volatility
+
+    return best_weights, best_sharpe, best_return, best_volatility
+
+# Per-process state of the NumPy worker pool, set by _init_worker
+_worker_shm = None
+_worker_simulator = None
+
+
+def _init_worker(simulator, shm_name, shape, dtype):
+    """
+    Attach a pool worker to the shared covariance matrix.
+
+    Args:
+        simulator (PortfolioSimulator): Simulator without its returns data.
+        shm_name (str): Name of the shared memory block holding the covariance.
+        shape (Tuple[int, int]): Shape of the covariance matrix.
+        dtype (np.dtype): Floating point type of the covariance matrix.
+    """
+    global _worker_shm, _worker_simulator, _rng
+    _rng = _new_rng()
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    simulator._cov = np.ndarray(shape, dtype=dtype, buffer=_worker_shm.buf)
+    _worker_simulator = simulator
+
+
+def _simulate_chunk_worker(columns):
+    """
+    Simulate a batch of combinations in a pool worker.
+
+    Args:
+        columns (np.ndarray): Column indices of the combinations, shape (n, k).
+
+    Returns:
+        List[Dict[str, Any]]: One result dictionary per combination.
+    """
+    return _worker_simulator._simulate_chunk(columns)
 
 class PortfolioSimulator:
     """
@@ -14,9 +219,13 @@ class PortfolioSimulator:
         risk_free_rate (float): Risk-free rate.
         num_simulations (int): Number of simulations to run.
         num_cores (int): Number of cores to use for parallel processing.
-        tickers (List[str]): List of tickers to simulate.
+        tickers (Optional[List[str]]): List of tickers to simulate (all return columns if None).
         select_k_tickers (int): Number of tickers to select for each simulation.
         max_weight (float): Maximum weight for each ticker.
+        dtype (np.dtype): Floating point type of the returns, their moments and the weights.
+        chunk_size (int): Number of combinations evaluated per batch.
+        method (str): ``"monte_carlo"`` to search random weight draws, or
+            ``"analytic"`` to solve for the tangency portfolio directly.
     """
 
     def __init__(
@@ -25,17 +234,51 @@ class PortfolioSimulator:
         risk_free_rate: float = 0.0,
         num_simulations: int = 1000,
         num_cores: int = 4,
-        tickers: List[str] = None,
+        tickers: Optional[List[str]] = None,
         select_k_tickers: int = 25,
-        max_weight: float = 0.2
+        max_weight: float = 0.2,
+        dtype: np.dtype = np.float32,
+        chunk_size: int = 64,
+        method: str = "monte_carlo"
     ):
-        self.returns = returns
+        if method not in ("monte_carlo", "analytic"):
+            raise ValueError(f"Unknown method {method!r}, expected 'monte_carlo' or 'analytic'")
+        
+        self.dtype = dtype
+        self.returns = returns.astype(dtype, copy=False)
+        
+        # Ticker -> column index, built once
+        self._col_ix = {ticker: i for i, ticker in enumerate(self.returns.columns)}
+        self._names = self.returns.columns.to_numpy()
+        
+        # Daily mean vector and (population) covariance matrix of all tickers.
+        # Every weight draw is scored from these instead of the returns matrix.
+        # They are accumulated in float64 and stored in ``dtype``.
+        R = np.ascontiguousarray(self.returns.to_numpy(dtype=dtype))
+        self._mu = R.mean(axis=0, dtype=np.float64).astype(dtype)
+        self._cov = np.cov(R, rowvar=False, ddof=0, dtype=np.float64).astype(dtype)
         self.risk_free_rate = risk_free_rate
         self.num_simulations = num_simulations
         self.num_cores = num_cores
-        self.tickers = tickers
+        self.tickers = list(self.returns.columns) if tickers is None else tickers
+        self._ticker_ix = np.array([self._col_ix[ticker] for ticker in self.tickers], dtype=np.intp)
         self.select_k_tickers = select_k_tickers
         self.max_weight = max_weight
+        self.chunk_size = chunk_size
+        self.method = method
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the simulator without its returns data.
+
+        Pool workers only need the moments and read the covariance matrix from
+        shared memory, so just the parameters, index tables and mean vector are
+        sent to each process.
+        """
+        state = self.__dict__.copy()
+        state['returns'] = None
+        state['_cov'] = None
+        return state
 
     def _generate_combinations(self) -> itertools.combinations:
         """
@@ -46,71 +289,264 @@ class PortfolioSimulator:
         """
         return itertools.combinations(self.tickers, self.select_k_tickers)
 
-    def _sample_weights(self, n_assets: int) -> np.ndarray:
+    def _combination_chunks(self) -> Iterator[np.ndarray]:
+        """
+        Lazily stream the combinations as column index arrays.
+
+        Only ``chunk_size`` combinations are materialized at a time, so memory
+        stays bounded no matter how many combinations there are.
+
+        Yields:
+            np.ndarray: Column indices into the returns matrix, shape (n, k).
+        """
+        it = itertools.combinations(range(len(self.tickers)), self.select_k_tickers)
+        for chunk in iter(lambda: list(itertools.islice(it, self.chunk_size)), []):
+            yield self._ticker_ix[np.array(chunk, dtype=np.intp)]
+
+    def _sample_weights(self, n_assets: int, size: Optional[Union[int, Tuple[int, ...]]] = None) -> np.ndarray:
         """
         Sample random weights for the portfolio.
 
         Args:
             n_assets (int): Number of assets in the portfolio.
+            size (Optional[Union[int, Tuple[int, ...]]]): Batch shape of weight vectors to draw.
 
         Returns:
-            np.ndarray: Random weights for the portfolio.
+            np.ndarray: Random weights, shape (*size, n_assets).
         """
-        weights = np.random.dirichlet(np.ones(n_assets))
-        return weights / sum(weights)
+        # Dirichlet draws already sum to one
+        return _rng.dirichlet(np.ones(n_assets), size=size).astype(self.dtype, copy=False)
     
     def _apply_max_weight_constraint(self, weights: np.ndarray) -> np.ndarray:
         """
         Apply maximum weight constraint to the portfolio weights.
+
+        Weights above the maximum are fixed at ``max_weight`` and the remaining
+        budget is shared among the other tickers in proportion to their original
+        weights, repeating until no weight exceeds the maximum (at most
+        ``n_assets`` passes, usually one or two). Works row-wise on a batch of
+        weight vectors; all rows are updated together in every pass.
         
         Args:
-            weights (np.ndarray): Original portfolio weights.
+            weights (np.ndarray): Original portfolio weights, shape (..., n_assets).
             
         Returns:
             np.ndarray: Adjusted weights that respect the maximum weight constraint.
         """
+        n_assets = weights.shape[-1]
+        
         # If max_weight is 1.0 or greater, no constraint needed
         if self.max_weight >= 1.0:
             return weights
-            
-        # Create a copy of the weights to avoid modifying the original
-        adjusted_weights = weights.copy()
         
-        # Find weights that exceed the maximum
-        excess_mask = adjusted_weights > self.max_weight
-        excess_weights = adjusted_weights[excess_mask]
+        # If the cap cannot be met, the closest feasible portfolio is equal-weight
+        if self.max_weight * n_assets <= 1.0:
+            return np.full_like(weights, 1.0 / n_assets)
         
-        # If no weights exceed the maximum, return the original weights
-        if not np.any(excess_mask):
-            return adjusted_weights
+        capped = np.zeros(weights.shape, dtype=bool)
+        adjusted_weights = weights
+        for _ in range(n_assets):
+            # Find weights that exceed the maximum
+            excess_mask = adjusted_weights > self.max_weight
+            if not excess_mask.any():
+                break
+            capped |= excess_mask
             
-        # Calculate the total excess weight
-        total_excess = np.sum(excess_weights) - self.max_weight * np.sum(excess_mask)
-        
-        # Cap the weights that exceed the maximum
-        adjusted_weights[excess_mask] = self.max_weight
-        
-        # Find weights that are below the maximum
-        below_max_mask = ~excess_mask
-        below_max_weights = adjusted_weights[below_max_mask]
-        
-        # If there are no weights below the maximum, we need to redistribute
-        if not np.any(below_max_mask):
-            # In this case, we need to set all weights to max_weight
-            # and then normalize to ensure they sum to 1
-            adjusted_weights = np.ones_like(adjusted_weights) * self.max_weight
-            return adjusted_weights / np.sum(adjusted_weights)
-            
-        # Calculate the sum of weights below the maximum
-        sum_below_max = np.sum(below_max_weights)
+            # Cap them and scale the uncapped weights to fill the remaining budget
+            budget = 1.0 - self.max_weight * capped.sum(axis=-1, keepdims=True)
+            uncapped_sum = np.where(capped, 0, weights).sum(axis=-1, keepdims=True)
+            adjusted_weights = np.where(capped, self.max_weight, weights * (budget / uncapped_sum))
         
-        # Redistribute the excess weight proportionally to weights below the maximum
-        if sum_below_max > 0:
-            redistribution_factor = total_excess / sum_below_max
-            adjusted_weights[below_max_mask] += below_max_weights * redistribution_factor
+        return adjusted_weights.astype(weights.dtype, copy=False)
+    
+    def _simulate_numpy(self, mu: np.ndarray, cov: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        NumPy Monte-Carlo search for a batch of combinations.
+
+        All weight draws of all combinations are evaluated at once: the daily
+        mean of each draw is ``W @ mu`` and its variance the quadratic form
+        ``w' Cov w``, both computed with batched matmuls.
+
+        Args:
+            mu (np.ndarray): Mean daily returns, shape (n_combos, k).
+            cov (np.ndarray): Covariance of daily returns, shape (n_combos, k, k).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Best weights
+            (n_combos, k), Sharpe ratios, annualized returns and annualized
+            volatilities (n_combos,).
+        """
+        n_combos, k = mu.shape
+        
+        # Sample all weight vectors at once, shape (n_combos, num_simulations, k)
+        weights = self._sample_weights(k, size=(n_combos, self.num_simulations))
+        weights = self._apply_max_weight_constraint(weights)
+        
+        # Daily mean and variance of every simulation, shape (n_combos, num_simulations)
+        means = np.matmul(weights, mu[:, :, None])[..., 0]
+        variances = np.einsum('csk,csk->cs', np.matmul(weights, cov), weights)
+        
+        # Compute annualized metrics for every simulation
+        annualized_returns = means * TRADING_DAYS
+        annualized_volatilities = np.sqrt(np.maximum(variances, 0) * TRADING_DAYS)
+        sharpe_ratios = np.divide(
+            annualized_returns - self.risk_free_rate,
+            annualized_volatilities,
+            out=np.zeros_like(annualized_returns),
+            where=annualized_volatilities != 0
+        )
+        
+        # Keep the simulation with the best Sharpe ratio of each combination,
+        # ranking NaN as -inf (np.argmax would pick the first NaN)
+        rows = np.arange(n_combos)
+        best = np.argmax(np.where(np.isnan(sharpe_ratios), -np.inf, sharpe_ratios), axis=1)
+        return (
+            weights[rows, best],
+            sharpe_ratios[rows, best],
+            annualized_returns[rows, best],
+            annualized_volatilities[rows, best]
+        )
+    
+    def _simulate_monte_carlo(self, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Monte-Carlo search for a batch of combinations.
+
+        Uses the compiled ``_simulate_kernel`` when Numba is available and the
+        batched NumPy search otherwise.
+
+        Args:
+            columns (np.ndarray): Column indices of the combinations, shape (n, k).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Best weights
+            (n, k), Sharpe ratios, annualized returns and annualized
+            volatilities (n,).
+        """
+        if NUMBA_AVAILABLE:
+            return _simulate_kernel(
+                self._mu,
+                self._cov,
+                columns,
+                self.num_simulations,
+                self.risk_free_rate,
+                self.max_weight
+            )
+        
+        # Gather the (n_combos, k) means and (n_combos, k, k) covariances
+        return self._simulate_numpy(
+            self._mu[columns],
+            self._cov[columns[:, :, None], columns[:, None, :]]
+        )
+    
+    def _solve_analytic(self, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Maximum Sharpe ratio (tangency) portfolio for a batch of combinations.
+
+        The unconstrained optimum is ``w ~ Cov^-1 (mu - rf / 252)``. When it is
+        long-only and within ``max_weight`` it is used as is; otherwise the
+        bounded problem is solved with SLSQP. Combinations that cannot be
+        solved (no SciPy, singular covariance, optimizer failure) fall back to
+        the Monte-Carlo search.
+
+        Args:
+            columns (np.ndarray): Column indices of the combinations, shape (n, k).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Best weights
+            (n, k), Sharpe ratios, annualized returns and annualized
+            volatilities (n,).
+        """
+        n_combos, k = columns.shape
+        # Solved in float64; the solvers need the precision more than the bandwidth
+        mu = self._mu[columns].astype(np.float64)
+        cov = self._cov[columns[:, :, None], columns[:, None, :]].astype(np.float64)
+        excess = mu - self.risk_free_rate / TRADING_DAYS
+        max_weight = min(self.max_weight, 1.0)
+        
+        weights = np.full((n_combos, k), 1.0 / k)
+        solved = np.zeros(n_combos, dtype=bool)
+        
+        if max_weight * k > 1.0:
+            # Unconstrained tangency portfolio, one batched solve
+            try:
+                x = np.linalg.solve(cov, excess[:, :, None])[..., 0]
+            except np.linalg.LinAlgError:
+                x = np.full((n_combos, k), np.nan)
+            total = x.sum(axis=1, keepdims=True)
+            w = np.divide(x, total, out=np.full_like(x, np.nan), where=total > 0)
+            solved = np.all((w >= 0) & (w <= max_weight), axis=1)
+            weights[solved] = w[solved]
             
-        # Normalize to ensure weights sum to 1
-        return adjusted_weights / np.sum(adjusted_weights)
+            # Bounded, long-only problem where the cap or the sign binds, as the
+            # convex QP min y'Cov y s.t. excess'y = 1, 0 <= y <= max_weight * sum(y)
+            # with w = y / sum(y) (needs a portfolio with positive excess return)
+            if minimize is not None:
+                for c in np.flatnonzero(~solved & (excess.max(axis=1) > 0)):
+                    m, s = excess[c], cov[c]
+                    y0 = np.where(m > 0, m, 0.0)
+                    result = minimize(
+                        lambda y: y @ s @ y,
+                        y0 / (m @ y0),
+                        jac=lambda y: 2.0 * (s @ y),
+                        method="SLSQP",
+                        bounds=[(0.0, None)] * k,
+                        options={"ftol": 1e-12},
+                        constraints=(
+                            {"type": "eq", "fun": lambda y: m @ y - 1.0, "jac": lambda y: m},
+                            {"type": "ineq", "fun": lambda y: max_weight * y.sum() - y,
+                             "jac": lambda y: max_weight - np.eye(k)}
+                        )
+                    )
+                    if result.success and result.x.sum() > 0 and abs(m @ result.x - 1.0) < 1e-6:
+                        weights[c] = np.clip(result.x / result.x.sum(), 0.0, max_weight)
+                        solved[c] = True
+        else:
+            # Equal weights are the only (or the closest) feasible portfolio
+            solved[:] = True
+        
+        annualized_returns = np.einsum('ck,ck->c', weights, mu) * TRADING_DAYS
+        variances = np.einsum('ck,ckl,cl->c', weights, cov, weights)
+        annualized_volatilities = np.sqrt(np.maximum(variances, 0) * TRADING_DAYS)
+        sharpe_ratios = np.divide(
+            annualized_returns - self.risk_free_rate,
+            annualized_volatilities,
+            out=np.zeros_like(annualized_returns),
+            where=annualized_volatilities != 0
+        )
+        
+        if not solved.all():
+            fallback = self._simulate_monte_carlo(columns[~solved])
+            for out, values in zip((weights, sharpe_ratios, annualized_returns, annualized_volatilities), fallback):
+                out[~solved] = values
+        
+        return weights, sharpe_ratios, annualized_returns, annualized_volatilities
+    
+    def _simulate_chunk(self, columns: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Find the best portfolio of each combination in a batch.
+
+        Args:
+            columns (np.ndarray): Column indices of the combinations, shape (n, k).
+
+        Returns:
+            List[Dict[str, Any]]: One result dictionary per combination.
+        """
+        if self.method == "analytic":
+            best_weights, best_sharpe, best_return, best_volatility = self._solve_analytic(columns)
+        else:
+            best_weights, best_sharpe, best_return, best_volatility = self._simulate_monte_carlo(columns)
+        
+        # Create result dictionaries
+        return [
+            {
+                'tickers': self._names[combo].tolist(),
+                'weights': best_weights[i].tolist(),
+                'sharpe_ratio': float(best_sharpe[i]),
+                'annualized_return': float(best_return[i]),
+                'annualized_volatility': float(best_volatility[i])
+            }
+            for i, combo in enumerate(columns)
+        ]
     
     def _simulate_one(self, combo: Tuple[str, ...]) -> Dict[str, Any]:
         """
@@ -122,71 +558,77 @@ class PortfolioSimulator:
         Returns:
             Dict[str, Any]: Dictionary containing simulation results.
         """
-        # Extract returns for the selected tickers
-        selected_returns = self.returns[list(combo)]
-        
-        # Run multiple simulations with different weights
-        best_sharpe = -np.inf
-        best_weights = np.ones(len(combo)) / len(combo)  # Initialize with equal weights
-        best_annualized_return = 0
-        best_annualized_volatility = 0
-        
-        for _ in range(self.num_simulations):
-            # Sample random weights
-            weights = self._sample_weights(len(combo))
-            weights = self._apply_max_weight_constraint(weights)    
-            
-            # Compute portfolio returns
-            portfolio_returns = PortfolioMetrics.compute_portfolio_returns(
-                weights=weights,
-                returns=selected_returns
-            )
-            
-            # Compute metrics
-            annualized_return = PortfolioMetrics.annualized_return(portfolio_returns)
-            annualized_volatility = PortfolioMetrics.compute_portfolio_annualized_volatility(portfolio_returns)
-            sharpe_ratio = PortfolioMetrics.compute_portfolio_sharpe_ratio(
-                portfolio_returns,
-                self.risk_free_rate
-            )
-            
-            # Update best if current simulation is better
-            if sharpe_ratio > best_sharpe:
-                best_sharpe = sharpe_ratio
-                best_weights = weights
-                best_annualized_return = annualized_return
-                best_annualized_volatility = annualized_volatility
-        
-        # Create result dictionary
-        result = {
-            'tickers': list(combo),
-            'weights': best_weights.tolist(),
-            'sharpe_ratio': best_sharpe,
-            'annualized_return': best_annualized_return,
-            'annualized_volatility': best_annualized_volatility
-        }
-        
-        return result
+        columns = np.array([[self._col_ix[ticker] for ticker in combo]], dtype=np.intp)
+        return self._simulate_chunk(columns)[0]
     
+    def _run_pool(self, chunks: Iterator[np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        Simulate the chunks on a process pool backed by shared memory.
+
+        The covariance matrix is copied into a shared memory block once. Each
+        worker attaches to it on start-up, so tasks only carry index arrays.
+        At most ``2 * num_cores`` chunks are in flight at a time, so the chunk
+        generator is consumed as workers free up rather than all at once.
+
+        Args:
+            chunks (Iterator[np.ndarray]): Column index arrays to simulate.
+
+        Returns:
+            List[Dict[str, Any]]: One result dictionary per combination.
+        """
+        shm = shared_memory.SharedMemory(create=True, size=self._cov.nbytes)
+        shared = np.ndarray(self._cov.shape, dtype=self._cov.dtype, buffer=shm.buf)
+        try:
+            shared[:] = self._cov
+            with ProcessPoolExecutor(
+                max_workers=self.num_cores,
+                initializer=_init_worker,
+                initargs=(self, shm.name, self._cov.shape, self._cov.dtype)
+            ) as executor:
+                # Keep a bounded window of futures and refill it in submission
+                # order; Executor.map would drain the generator up front
+                pending = deque(
+                    executor.submit(_simulate_chunk_worker, chunk)
+                    for chunk in itertools.islice(chunks, 2 * self.num_cores)
+                )
+                results = []
+                while pending:
+                    results.extend(pending.popleft().result())
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append(executor.submit(_simulate_chunk_worker, chunk))
+                return results
+        finally:
+            del shared
+            shm.close()
+            shm.unlink()
+
     def run(self) -> pd.DataFrame:
         """
         Run the simulation.
+
+        Combinations are streamed in chunks of ``chunk_size`` and only the best
+        portfolio of each combination is kept. With Numba the chunks run in-process
+        on ``num_cores`` threads; otherwise they are distributed over
+        ``num_cores`` worker processes that share the covariance matrix.
         
         Returns:
             pd.DataFrame: DataFrame containing simulation results.
         """
-        # Generate all possible combinations
-        combinations = list(self._generate_combinations())
+        # Stream the combinations lazily
+        chunks = self._combination_chunks()
         
         # Run simulations in parallel
-        results = Parallel(n_jobs=self.num_cores)(
-            delayed(self._simulate_one)(combo) for combo in combinations
-        )
+        if NUMBA_AVAILABLE:
+            set_num_threads(self.num_cores)
+            results = [result for chunk in chunks for result in self._simulate_chunk(chunk)]
+        else:
+            results = self._run_pool(chunks)
         
         # Convert results to DataFrame
         df_results = pd.DataFrame(results)
         
-        # Sort by Sharpe ratio in descending order
-        df_results = df_results.sort_values('sharpe_ratio', ascending=False)
+        # Sort by Sharpe ratio in descending order; NaN (combinations holding a
+        # ticker with missing returns) goes last
+        df_results = df_results.sort_values('sharpe_ratio', ascending=False, na_position='last')
         
-        return df_results
\ No newline at end of file
+        return df_results
@@ -1,16 +1,449 @@
+import math
+from collections import namedtuple
 import numpy as np
 import pandas as pd
-from typing import Sequence
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+from ._njit import njit, prange, FASTMATH, NUMBA_AVAILABLE
+
+try:
+    import numexpr as ne
+except ImportError:  # frontier metrics fall back to plain NumPy expressions
+    ne = None
+
+# Contiguous float64 vector types of the kernel signatures, writable and
+# read-only (pandas hands out read-only views under copy-on-write)
+_VECTOR_TYPES = ("f8[::1]", "Array(f8, 1, 'C', readonly=True)")
+
+# float32 counterparts, for kernels that read float32 returns without upcasting
+_F4_VECTOR_TYPES = ("f4[::1]", "Array(f4, 1, 'C', readonly=True)")
+
+# Annualized return, annualized volatility and Sharpe ratio of one return series
+Metrics = namedtuple("Metrics", "ann_ret ann_vol sharpe")
+
+# Tolerance of the weights-sum check, np.isclose(total, 1.0) defaults (atol + rtol)
+_WEIGHT_SUM_TOL = 1e-8 + 1e-5
+
+
+@lru_cache(maxsize=None)
+def _sqrt_trading_days(trading_days: int) -> float:
+    """
+    Square root of the trading days, computed once per value.
+
+    Args:
+        trading_days (int): Number of trading days in a year.
+
+    Returns:
+        float: sqrt(trading_days).
+    """
+    return math.sqrt(trading_days)
+
+
+@njit([f"f8({v}, f8)" for v in _VECTOR_TYPES + _F4_VECTOR_TYPES], cache=True, fastmath=FASTMATH)
+def _sharpe_nb(r, rf):
+    """
+    Sharpe ratio of daily returns in a single pass over the array.
+
+    Accumulates the sum and sum of squares together, so the mean and the
+    (population) variance come from one read of ``r``. The sums run in float64
+    over ``r - r[0]``: shifting by a sample keeps the sum of squares from
+    cancelling against the squared mean, so float32 inputs can be read as is
+    without losing accuracy.
+
+    Args:
+        r (np.ndarray): Daily returns, float32 or float64 and contiguous.
+        rf (float): Risk-free rate.
+
+    Returns:
+        float: Sharpe ratio, 0.0 when the volatility is zero and NaN for
+        empty input or NaN returns.
+    """
+    n = r.shape[0]
+    if n == 0:
+        return np.nan
+    shift = np.float64(r[0])
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        d = r[i] - shift
+        s += d
+        ss += d * d
+    mean = s / n
+    var = ss / n - mean * mean
+    if var <= 0.0:
+        return 0.0
+    return (mean + shift - rf) / np.sqrt(var)
+
+
+@njit([f"f8({v}, f8)" for v in _VECTOR_TYPES], cache=True, fastmath=FASTMATH)
+def _annualized_return_nb(r, trading_days):
+    """
+    Annualized return of daily returns: mean(r) * trading_days.
+
+    Args:
+        r (np.ndarray): Daily returns, float64 and contiguous.
+        trading_days (float): Number of trading days in a year (a float, so
+            non-integer day counts are not truncated).
+
+    Returns:
+        float: Annualized return, NaN for empty input.
+    """
+    if r.shape[0] == 0:
+        return np.nan
+    s = 0.0
+    for i in range(r.shape[0]):
+        s += r[i]
+    return s / r.shape[0] * trading_days
+
+
+@njit([f"f8({v}, f8)" for v in _VECTOR_TYPES], cache=True, fastmath=FASTMATH)
+def _annualized_volatility_nb(r, sqrt_td):
+    """
+    Annualized (population) volatility of daily returns in a single pass.
+
+    Args:
+        r (np.ndarray): Daily returns, float64 and contiguous.
+        sqrt_td (float): Square root of the trading days in a year.
+
+    Returns:
+        float: Annualized volatility, NaN for empty input.
+    """
+    n = r.shape[0]
+    if n == 0:
+        return np.nan
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        s += r[i]
+        ss += r[i] * r[i]
+    mean = s / n
+    var = ss / n - mean * mean
+    if var < 0.0:  # rounding; NaN passes through
+        var = 0.0
+    return np.sqrt(var) * sqrt_td
+
+
+@njit(
+    [f"UniTuple(f8, 3)({v}, f8, f8, f8)" for v in _VECTOR_TYPES + _F4_VECTOR_TYPES],
+    cache=True,
+    fastmath=FASTMATH,
+)
+def _all_metrics(r, rf, trading_days, sqrt_td):
+    """
+    Annualized return, annualized volatility and Sharpe ratio in a single pass.
+
+    Uses the shifted float64 sums of ``_sharpe_nb``, so the three metrics cost
+    one read of ``r``.
+
+    Args:
+        r (np.ndarray): Daily returns, float32 or float64 and contiguous.
+        rf (float): Risk-free rate.
+        trading_days (float): Number of trading days in a year (a float, so
+            non-integer day counts are not truncated).
+        sqrt_td (float): Square root of ``trading_days``.
+
+    Returns:
+        Tuple[float, float, float]: Annualized return, annualized volatility
+        and Sharpe ratio (0.0 when the volatility is zero). All three are NaN
+        for empty input or NaN returns.
+    """
+    n = r.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan
+    shift = np.float64(r[0])
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        d = r[i] - shift
+        s += d
+        ss += d * d
+    mean = s / n
+    var = ss / n - mean * mean
+    if var < 0.0:  # rounding; NaN passes through
+        var = 0.0
+    std = np.sqrt(var)
+    mean += shift
+    sharpe = 0.0 if std == 0.0 else (mean - rf) / std
+    return mean * trading_days, std * sqrt_td, sharpe
+
+
+@njit(parallel=True, cache=True, fastmath=FASTMATH)
+def _batch_metrics(R, W, rf, trading_days, sqrt_td):
+    """
+    Annualized return, annualized volatility and Sharpe ratio of many portfolios.
+
+    Portfolios are spread over threads with ``prange``; each one makes a single
+    pass over the days, so the (n_days, n_portfolios) returns are never stored.
+    As in ``_sharpe_nb``, the sums are taken over returns shifted by the first
+    day's, so a constant portfolio gets exactly zero volatility.
+
+    Args:
+        R (np.ndarray): Daily returns, C-contiguous, shape (n_days, n_assets).
+        W (np.ndarray): Weights with one portfolio per column, shape (n_assets, n_portfolios).
+        rf (float): Risk-free rate.
+        trading_days (int): Number of trading days in a year.
+        sqrt_td (float): Square root of ``trading_days``.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Annualized returns,
+        annualized volatilities and Sharpe ratios, shape (n_portfolios,). The
+        Sharpe ratio is 0.0 where the volatility is zero and NaN where it is NaN.
+    """
+    n_days, n_assets = R.shape
+    n_portfolios = W.shape[1]
+    ann_ret = np.empty(n_portfolios)
+    ann_vol = np.empty(n_portfolios)
+    sharpe = np.empty(n_portfolios)
+    if n_days == 0:
+        ann_ret[:] = np.nan
+        ann_vol[:] = np.nan
+        sharpe[:] = np.nan
+        return ann_ret, ann_vol, sharpe
+
+    for k in prange(n_portfolios):
+        w = np.ascontiguousarray(W[:, k])
+        shift = 0.0
+        for j in range(n_assets):
+            shift += R[0, j] * w[j]
+        s = 0.0
+        ss = 0.0
+        for t in range(n_days):
+            r = 0.0
+            for j in range(n_assets):
+                r += R[t, j] * w[j]
+            d = r - shift
+            s += d
+            ss += d * d
+        mean = s / n_days
+        var = ss / n_days - mean * mean
+        if var < 0.0:  # rounding; NaN passes through
+            var = 0.0
+        std = np.sqrt(var)
+        mean += shift
+        ann_ret[k] = mean * trading_days
+        ann_vol[k] = std * sqrt_td
+        sharpe[k] = 0.0 if std == 0.0 else (mean - rf) / std
+
+    return ann_ret, ann_vol, sharpe
+
+
+@njit(cache=True)
+def _welford_push(state, x):
+    """
+    Add one observation to Welford running moments ``state = [n, mean, M2]``.
+    """
+    state[0] += 1.0
+    delta = x - state[1]
+    state[1] += delta / state[0]
+    state[2] += delta * (x - state[1])
+
+
+@njit(cache=True)
+def _welford_pop(state, x):
+    """
+    Remove one observation from Welford running moments ``state = [n, mean, M2]``.
+    """
+    state[0] -= 1.0
+    if state[0] <= 0.0:
+        state[0] = 0.0
+        state[1] = 0.0
+        state[2] = 0.0
+        return
+    delta = x - state[1]
+    state[1] -= delta / state[0]
+    # A single observation has no spread; drop the rounding residue
+    state[2] = 0.0 if state[0] == 1.0 else max(state[2] - delta * (x - state[1]), 0.0)
+
+
+@njit(cache=True)
+def _rolling_sharpe_nb(buffer, state, head, values, rf, out):
+    """
+    Push ``values`` through a rolling window and record the Sharpe ratio after each.
+
+    Non-finite values take a slot in the window but are counted apart from the
+    Welford moments; the ratio is NaN while any of them is in the window and
+    exact again once the last one has left.
+
+    Args:
+        buffer (np.ndarray): Circular buffer of the window, shape (window,).
+        state (np.ndarray): Welford moments of the finite values plus the count
+            of non-finite ones, ``[n, mean, M2, n_invalid]``, updated in place.
+        head (int): Buffer position of the oldest observation.
+        values (np.ndarray): New daily returns.
+        rf (float): Risk-free rate.
+        out (np.ndarray): Sharpe ratio after each value, shape (len(values),).
+
+    Returns:
+        int: Buffer position of the oldest observation afterwards.
+    """
+    window = buffer.shape[0]
+    for i in range(values.shape[0]):
+        x = values[i]
+        n = int(state[0] + state[3])
+        if n == window:
+            oldest = buffer[head]
+            if np.isfinite(oldest):
+                _welford_pop(state, oldest)
+            else:
+                state[3] -= 1.0
+            buffer[head] = x
+            head = (head + 1) % window
+        else:
+            buffer[(head + n) % window] = x
+        if np.isfinite(x):
+            _welford_push(state, x)
+        else:
+            state[3] += 1.0
+
+        if state[3] > 0.0:
+            out[i] = np.nan
+        else:
+            var = state[2] / state[0]
+            out[i] = (state[1] - rf) / np.sqrt(var) if var > 0.0 else 0.0
+    return head
+
+
+def _as_vector(returns: Sequence[float], keep_float32: bool = False) -> np.ndarray:
+    """
+    Flat, contiguous daily returns for the 1-D kernels.
+
+    Single-column frames and (n, 1) arrays are flattened, as ``np.mean`` and
+    ``np.std`` do in the NumPy paths.
+
+    Args:
+        returns (Sequence[float]): Daily returns.
+        keep_float32 (bool): Pass float32 arrays through without upcasting.
+
+    Returns:
+        np.ndarray: 1-D float64 (or float32) returns.
+    """
+    if keep_float32 and isinstance(returns, np.ndarray) and returns.dtype == np.float32:
+        return np.ascontiguousarray(returns).ravel()
+    return np.ascontiguousarray(returns, dtype=np.float64).ravel()
+
+
+def _as_returns_array(
+    returns: Union[pd.DataFrame, np.ndarray],
+    dtype: np.dtype = np.float32
+) -> np.ndarray:
+    """
+    Matrix of daily returns in ``dtype``, without a copy where possible.
+
+    Args:
+        returns (Union[pd.DataFrame, np.ndarray]): Daily returns, shape (n_days, n_assets).
+        dtype (np.dtype): Floating point type of the result.
+
+    Returns:
+        np.ndarray: Daily returns as ``dtype``.
+    """
+    if isinstance(returns, np.ndarray):
+        return np.asarray(returns, dtype=dtype)
+    return returns.to_numpy(dtype=dtype, copy=False)
 
 class PortfolioMetrics:
     """
     Helper functions to compute portfolio metrics.
+
+    The static methods accept returns as a DataFrame or an ndarray. For
+    repeated calls on the same returns, ``PortfolioMetrics.from_returns`` keeps
+    the converted matrix and exposes the same computations as methods.
+
+    Portfolio returns are computed in float32 by default: it halves the memory
+    traffic of the matrix products and is precise enough to rank candidate
+    portfolios. Pass ``dtype=np.float64`` where full precision matters.
+
+    Sharpe ratios are daily by default: (mean daily return - risk_free_rate) /
+    daily volatility, with ``risk_free_rate`` a daily rate. The batch methods
+    take ``annualize=True`` to return the annualized ratio reported by
+    ``PortfolioSimulator``, (annualized return - risk_free_rate) / annualized
+    volatility, with ``risk_free_rate`` an annual rate.
+
+    Attributes:
+        returns_array (Optional[np.ndarray]): Cached C-contiguous daily returns
+            (float32 unless requested otherwise), shape (n_days, n_assets).
     """
 
+    def __init__(self, returns_array: Optional[np.ndarray] = None):
+        self.returns_array = returns_array
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns: Union[pd.DataFrame, np.ndarray],
+        dtype: np.dtype = np.float32
+    ) -> "PortfolioMetrics":
+        """
+        Convert the returns once and keep them for later metric calls.
+
+        Args:
+            returns (Union[pd.DataFrame, np.ndarray]): Daily returns, shape (n_days, n_assets).
+            dtype (np.dtype): Floating point type of the cached returns.
+
+        Returns:
+            PortfolioMetrics: Instance holding the converted returns.
+        """
+        return cls(np.ascontiguousarray(_as_returns_array(returns, dtype)))
+
+    def portfolio_returns(self, weights: Sequence[float]) -> np.ndarray:
+        """
+        ``compute_portfolio_returns`` on the cached returns.
+
+        Args:
+            weights (Sequence[float]): List of weights for each stock.
+
+        Returns:
+            np.ndarray: Array containing portfolio returns (in the cached dtype).
+        """
+        return PortfolioMetrics.compute_portfolio_returns(
+            weights, self.returns_array, self.returns_array.dtype
+        )
+
+    def portfolio_returns_batch(self, weights_matrix: np.ndarray) -> np.ndarray:
+        """
+        ``compute_portfolio_returns_batch`` on the cached returns.
+
+        Args:
+            weights_matrix (np.ndarray): Weights with one portfolio per column,
+                shape (n_assets, n_portfolios).
+
+        Returns:
+            np.ndarray: Portfolio returns (in the cached dtype), shape (n_days, n_portfolios).
+        """
+        return PortfolioMetrics.compute_portfolio_returns_batch(
+            weights_matrix, self.returns_array, self.returns_array.dtype
+        )
+
+    def batch_metrics(
+        self,
+        weights_matrix: np.ndarray,
+        risk_free_rate: float = 0.0,
+        trading_days: int = 252,
+        annualize: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        ``compute_batch_metrics`` on the cached returns.
+
+        Args:
+            weights_matrix (np.ndarray): Weights with one portfolio per column,
+                shape (n_assets, n_portfolios).
+            risk_free_rate (float): Risk-free rate (annual if ``annualize``, else daily).
+            trading_days (int): Number of trading days in a year.
+            annualize (bool): Return the annualized Sharpe ratio instead of the daily one.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Annualized returns,
+            annualized volatilities and Sharpe ratios, shape (n_portfolios,).
+        """
+        return PortfolioMetrics.compute_batch_metrics(
+            weights_matrix, self.returns_array, risk_free_rate, trading_days,
+            self.returns_array.dtype, annualize
+        )
+
     @staticmethod
     def compute_portfolio_returns(
         weights: Sequence[float],
-        returns: pd.DataFrame
+        returns: Union[pd.DataFrame, np.ndarray],
+        dtype: np.dtype = np.float32
     ) -> np.ndarray:
         """
         Compute portfolio returns given prices and weights:
@@ -18,26 +451,130 @@ class PortfolioMetrics:
 
         Args:
             weights (Sequence[float]): List of weights for each stock.
-            returns (pd.DataFrame): DataFrame containing daily returns.
+            returns (Union[pd.DataFrame, np.ndarray]): Daily returns.
+            dtype (np.dtype): Floating point type of the computation.
 
         Returns:
-            np.ndarray: Array containing portfolio returns.
+            np.ndarray: Array containing portfolio returns (``dtype``).
         """
-        # Convert weights to numpy array
-        weights_array = np.array(weights)
+        # Convert weights to numpy array (arrays of ``dtype`` are used as is)
+        weights_array = np.asarray(weights, dtype=dtype)
         
-        # Ensure weights sum to 1
-        if not np.isclose(np.sum(weights_array), 1.0):
+        # Ensure weights sum to 1, with np.isclose's default tolerance as a
+        # scalar check
+        if abs(float(weights_array.sum()) - 1.0) > _WEIGHT_SUM_TOL:
             raise ValueError("Weights must sum to 1.0")
         
-        # Convert DataFrame to numpy array for matrix multiplication
-        returns_array = returns.values
+        # View the returns as ``dtype`` (no copy for frames and arrays that
+        # already have it). Frame views are Fortran-ordered, which BLAS handles
+        # directly.
+        returns_array = _as_returns_array(returns, dtype)
         
-        # Compute portfolio returns using matrix multiplication
-        portfolio_returns = returns_array.dot(weights_array)
+        # Compute portfolio returns with one matrix-vector product (SGEMV for float32)
+        portfolio_returns = np.matmul(returns_array, weights_array)
         
         return portfolio_returns
 
+    @staticmethod
+    def compute_portfolio_returns_batch(
+        weights_matrix: np.ndarray,
+        returns: Union[pd.DataFrame, np.ndarray],
+        dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """
+        Compute the returns of many portfolios at once:
+        returns = returns @ weights_matrix
+
+        One matrix-matrix product (SGEMM) replaces a matrix-vector product per
+        portfolio, so the returns matrix is read once for all candidates.
+
+        Args:
+            weights_matrix (np.ndarray): Weights with one portfolio per column,
+                shape (n_assets, n_portfolios).
+            returns (Union[pd.DataFrame, np.ndarray]): Daily returns.
+            dtype (np.dtype): Floating point type of the computation.
+
+        Returns:
+            np.ndarray: Portfolio returns (``dtype``), shape (n_days, n_portfolios).
+        """
+        # Convert weights to numpy array (arrays of ``dtype`` are used as is)
+        weights_array = np.asarray(weights_matrix, dtype=dtype)
+        
+        # Ensure the weights of every portfolio sum to 1
+        if np.any(np.abs(weights_array.sum(axis=0, dtype=np.float64) - 1.0) > _WEIGHT_SUM_TOL):
+            raise ValueError("Weights must sum to 1.0")
+        
+        # Compute all portfolio returns in one matrix product
+        returns_array = _as_returns_array(returns, dtype)
+        return np.matmul(returns_array, weights_array)
+
+    @staticmethod
+    def compute_batch_metrics(
+        weights_matrix: np.ndarray,
+        returns: Union[pd.DataFrame, np.ndarray],
+        risk_free_rate: float = 0.0,
+        trading_days: int = 252,
+        dtype: np.dtype = np.float32,
+        annualize: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the annualized return, annualized volatility and Sharpe ratio
+        of many portfolios at once.
+
+        By default the Sharpe ratio follows ``compute_portfolio_sharpe_ratio``
+        (daily mean and volatility, daily risk-free rate); with ``annualize``
+        it follows ``PortfolioSimulator`` (annualized return and volatility,
+        annual risk-free rate). With Numba the portfolios are evaluated in
+        parallel without storing their daily returns.
+
+        Args:
+            weights_matrix (np.ndarray): Weights with one portfolio per column,
+                shape (n_assets, n_portfolios).
+            returns (Union[pd.DataFrame, np.ndarray]): Daily returns.
+            risk_free_rate (float): Risk-free rate (annual if ``annualize``, else daily).
+            trading_days (int): Number of trading days in a year.
+            dtype (np.dtype): Floating point type of the returns and weights;
+                the moments are always accumulated in float64.
+            annualize (bool): Return the annualized Sharpe ratio instead of the daily one.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Annualized returns,
+            annualized volatilities and Sharpe ratios, shape (n_portfolios,).
+            The Sharpe ratio is 0.0 where the volatility is zero and NaN where
+            the returns contain NaN.
+        """
+        # Both paths need one weight per asset column of the returns (the
+        # kernel would otherwise index past the weights or ignore some)
+        weights_array = np.asarray(weights_matrix, dtype=dtype)
+        n_assets = returns.shape[1]
+        if weights_array.ndim != 2 or weights_array.shape[0] != n_assets:
+            raise ValueError(
+                f"weights_matrix must have shape ({n_assets}, n_portfolios), got {weights_array.shape}"
+            )
+
+        # (R_ann - R_f) / sigma_ann = (mean - R_f / trading_days) / std * sqrt(trading_days),
+        # so the annualized ratio is the daily one on the de-annualized rate, rescaled
+        daily_rf = risk_free_rate / trading_days if annualize else risk_free_rate
+        
+        if NUMBA_AVAILABLE:
+            if np.any(np.abs(weights_array.sum(axis=0, dtype=np.float64) - 1.0) > _WEIGHT_SUM_TOL):
+                raise ValueError("Weights must sum to 1.0")
+            returns_array = np.ascontiguousarray(_as_returns_array(returns, dtype))
+            ann_ret, ann_vol, sharpe = _batch_metrics(
+                returns_array, weights_array, daily_rf, trading_days, _sqrt_trading_days(trading_days)
+            )
+        else:
+            # Batched NumPy fallback through one matrix product
+            portfolio_returns = PortfolioMetrics.compute_portfolio_returns_batch(weights_array, returns, dtype)
+            mean = portfolio_returns.mean(axis=0, dtype=np.float64)
+            std = portfolio_returns.std(axis=0, dtype=np.float64)
+            sharpe = np.divide(mean - daily_rf, std, out=np.zeros_like(mean), where=std != 0)
+            ann_ret, ann_vol = mean * trading_days, std * _sqrt_trading_days(trading_days)
+
+        if annualize:
+            sharpe *= _sqrt_trading_days(trading_days)
+        return ann_ret, ann_vol, sharpe
+
     @staticmethod
     def annualized_return(
         returns: Sequence[float],
@@ -54,8 +591,12 @@ class PortfolioMetrics:
         Returns:
             float: Annualized return.
         """
+        # Compiled kernel when Numba is available
+        if NUMBA_AVAILABLE:
+            return _annualized_return_nb(_as_vector(returns), trading_days)
+        
         # Convert returns to numpy array
-        returns_array = np.array(returns)
+        returns_array = np.asarray(returns, dtype=np.float64)
         
         # Calculate average daily return
         avg_daily_return = np.mean(returns_array)
@@ -74,6 +615,9 @@ class PortfolioMetrics:
         Compute annualized volatility given daily returns.
         sigma_ann = sqrt(trading_days) * std(R_daily)
 
+        The population standard deviation (ddof=0) is used. Contiguous float64
+        arrays are read in place; other inputs are converted once.
+
         Args:
             returns (Sequence[float]): List of daily returns.
             trading_days (int): Number of trading days in a year.
@@ -81,14 +625,21 @@ class PortfolioMetrics:
         Returns:
             float: Annualized volatility.
         """
-        # Convert returns to numpy array
-        returns_array = np.array(returns)
+        # Use float64 arrays as is, convert anything else once
+        if isinstance(returns, np.ndarray) and returns.dtype == np.float64:
+            returns_array = returns
+        else:
+            returns_array = np.asarray(returns, dtype=np.float64)
         
-        # Calculate daily volatility (standard deviation)
-        daily_volatility = np.std(returns_array)
+        # One-pass compiled kernel when Numba is available
+        if NUMBA_AVAILABLE:
+            return _annualized_volatility_nb(_as_vector(returns_array), _sqrt_trading_days(trading_days))
+        
+        # Calculate daily volatility (population standard deviation)
+        daily_volatility = np.std(returns_array, ddof=0)
         
         # Calculate annualized volatility
-        annualized_volatility = daily_volatility * np.sqrt(trading_days)
+        annualized_volatility = daily_volatility * _sqrt_trading_days(trading_days)
         
         return annualized_volatility
 
@@ -108,8 +659,13 @@ class PortfolioMetrics:
         Returns:
             float: Sharpe ratio.
         """
+        # One-pass compiled kernel when Numba is available; float32 arrays
+        # (e.g. from compute_portfolio_returns) are read without upcasting
+        if NUMBA_AVAILABLE:
+            return _sharpe_nb(_as_vector(returns, keep_float32=True), risk_free_rate)
+        
         # Convert returns to numpy array
-        returns_array = np.array(returns)
+        returns_array = np.asarray(returns, dtype=np.float64)
         
         # Calculate average daily return
         avg_daily_return = np.mean(returns_array)
@@ -123,4 +679,254 @@ class PortfolioMetrics:
             
         sharpe_ratio = (avg_daily_return - risk_free_rate) / daily_volatility
         
-        return sharpe_ratio
\ No newline at end of file
+        return sharpe_ratio
+
+    @staticmethod
+    def compute_all_metrics(
+        returns: Sequence[float],
+        risk_free_rate: float = 0.0,
+        trading_days: int = 252
+    ) -> Metrics:
+        """
+        Compute annualized return, annualized volatility and Sharpe ratio together.
+
+        Equivalent to calling ``annualized_return``,
+        ``compute_portfolio_annualized_volatility`` and
+        ``compute_portfolio_sharpe_ratio``, but the returns are read once.
+
+        Args:
+            returns (Sequence[float]): List of daily returns.
+            risk_free_rate (float): Risk-free rate.
+            trading_days (int): Number of trading days in a year.
+
+        Returns:
+            Metrics: Named tuple ``(ann_ret, ann_vol, sharpe)``.
+        """
+        # One-pass compiled kernel when Numba is available
+        if NUMBA_AVAILABLE:
+            return Metrics(*_all_metrics(
+                _as_vector(returns, keep_float32=True), risk_free_rate, trading_days, _sqrt_trading_days(trading_days)
+            ))
+        
+        # Mean and volatility computed once and shared by the three metrics
+        returns_array = np.asarray(returns, dtype=np.float64)
+        mean = float(np.mean(returns_array))
+        std = float(np.std(returns_array, ddof=0))
+        sharpe = 0.0 if std == 0 else (mean - risk_free_rate) / std
+        return Metrics(mean * trading_days, std * _sqrt_trading_days(trading_days), sharpe)
+
+    @staticmethod
+    def precompute(returns: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the per-asset mean and covariance of daily returns once.
+
+        Portfolio metrics of any weight vector follow from these without
+        touching the returns again: mean = w @ mu and variance = w @ Sigma @ w.
+
+        Args:
+            returns (pd.DataFrame): DataFrame containing daily returns.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Mean daily returns, shape (n_assets,),
+            and (population, ddof=0) covariance, shape (n_assets, n_assets).
+        """
+        returns_array = returns.to_numpy(dtype=np.float64, copy=False)
+        mu = returns_array.mean(axis=0)
+        sigma = np.cov(returns_array, rowvar=False, ddof=0)
+        return mu, sigma
+
+    @staticmethod
+    def annualized_return_from_weights(
+        weights: Sequence[float],
+        mu: np.ndarray,
+        trading_days: int = 252
+    ) -> float:
+        """
+        Compute annualized return from precomputed mean returns.
+        R_ann = (w @ mu) * trading_days
+
+        Args:
+            weights (Sequence[float]): List of weights for each stock.
+            mu (np.ndarray): Mean daily returns from ``precompute``.
+            trading_days (int): Number of trading days in a year.
+
+        Returns:
+            float: Annualized return.
+        """
+        return float(np.dot(weights, mu)) * trading_days
+
+    @staticmethod
+    def annualized_volatility_from_weights(
+        weights: Sequence[float],
+        sigma: np.ndarray,
+        trading_days: int = 252
+    ) -> float:
+        """
+        Compute annualized volatility from a precomputed covariance matrix.
+        sigma_ann = sqrt(w @ Sigma @ w * trading_days)
+
+        Args:
+            weights (Sequence[float]): List of weights for each stock.
+            sigma (np.ndarray): Covariance of daily returns from ``precompute``.
+            trading_days (int): Number of trading days in a year.
+
+        Returns:
+            float: Annualized volatility.
+        """
+        weights_array = np.asarray(weights, dtype=np.float64)
+        variance = float(weights_array @ sigma @ weights_array)
+        return math.sqrt(max(variance, 0.0)) * _sqrt_trading_days(trading_days)
+
+    @staticmethod
+    def compute_frontier_metrics(
+        weights_matrix: np.ndarray,
+        mu: np.ndarray,
+        sigma: np.ndarray,
+        risk_free_rate: float = 0.0,
+        trading_days: int = 252,
+        annualize: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute annualized return, volatility and Sharpe ratio for many portfolios.
+        R_ann = (W.T @ mu) * trading_days
+        sigma_ann = sqrt(diag(W.T @ Sigma @ W) * trading_days)
+        SR = (W.T @ mu - R_f) / sqrt(diag(W.T @ Sigma @ W))
+        SR_ann = (R_ann - R_f) / sigma_ann   (annualize=True)
+
+        Vectorized form of the ``*_from_weights`` methods: one matrix product
+        per metric instead of a Python loop over weight vectors. The Sharpe
+        ratio follows ``compute_batch_metrics`` with the same ``annualize``
+        flag, so both return the same metrics for the same weights. With
+        ``numexpr`` installed, the element-wise volatility and Sharpe
+        expressions are fused and evaluated without temporaries.
+
+        Args:
+            weights_matrix (np.ndarray): Weights, shape (n_assets, n_portfolios).
+            mu (np.ndarray): Mean daily returns from ``precompute``.
+            sigma (np.ndarray): Covariance of daily returns from ``precompute``.
+            risk_free_rate (float): Risk-free rate (annual if ``annualize``, else daily).
+            trading_days (int): Number of trading days in a year.
+            annualize (bool): Return the annualized Sharpe ratio instead of the daily one.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Annualized returns,
+            annualized volatilities and Sharpe ratios, each shape
+            (n_portfolios,). The Sharpe ratio is 0.0 where volatility is zero
+            and NaN where it is NaN.
+        """
+        W = np.asarray(weights_matrix, dtype=np.float64)
+
+        # Mean and variance of every portfolio at once
+        means = W.T @ mu
+        variances = np.einsum("ij,ij->j", W, sigma @ W)
+
+        # Same rescaling of the daily ratio as compute_batch_metrics
+        rf = float(risk_free_rate / trading_days if annualize else risk_free_rate)
+        scale = _sqrt_trading_days(trading_days) if annualize else 1.0
+
+        if ne is not None:
+            std = ne.evaluate("sqrt(where(variances < 0, 0, variances))")
+            sharpe = ne.evaluate("where(std == 0, 0, (means - rf) / std * scale)")
+        else:
+            std = np.sqrt(np.maximum(variances, 0.0))
+            sharpe = np.divide(
+                means - rf,
+                std,
+                out=np.zeros_like(means),
+                where=std != 0
+            )
+            if annualize:
+                sharpe *= scale
+        return means * trading_days, std * _sqrt_trading_days(trading_days), sharpe
+
+
+class RollingSharpe:
+    """
+    Sharpe ratio over a sliding window of daily returns, updated in O(1).
+
+    Keeps the window in a preallocated circular buffer and its mean and sum of
+    squared deviations as Welford running moments, so each new return costs a
+    constant amount of work instead of a pass over the window. The ratio
+    follows ``PortfolioMetrics.compute_portfolio_sharpe_ratio`` (population
+    volatility, 0.0 when it is zero, NaN while the window holds a NaN).
+
+    Attributes:
+        window (int): Number of most recent returns in the window.
+        risk_free_rate (float): Risk-free rate.
+    """
+
+    def __init__(self, window: int, risk_free_rate: float = 0.0):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        
+        self.window = window
+        self.risk_free_rate = risk_free_rate
+        self._buffer = np.empty(window, dtype=np.float64)
+        self._state = np.zeros(4, dtype=np.float64)  # n, mean, M2, n_invalid
+        self._head = 0
+
+    def __len__(self) -> int:
+        return int(self._state[0] + self._state[3])
+
+    def push(self, value: float) -> float:
+        """
+        Add a daily return, dropping the oldest one once the window is full.
+
+        Args:
+            value (float): New daily return.
+
+        Returns:
+            float: Sharpe ratio of the updated window.
+        """
+        return float(self.update(np.array([value], dtype=np.float64))[0])
+
+    def pop_oldest(self) -> float:
+        """
+        Remove the oldest daily return from the window.
+
+        Returns:
+            float: The removed daily return.
+        """
+        n = len(self)
+        if n == 0:
+            raise IndexError("pop from an empty window")
+        
+        value = self._buffer[self._head]
+        if np.isfinite(value):
+            _welford_pop(self._state, value)
+        else:
+            self._state[3] -= 1.0
+        self._head = (self._head + 1) % self.window if n > 1 else 0
+        return float(value)
+
+    def update(self, returns: Sequence[float]) -> np.ndarray:
+        """
+        Push many daily returns in one compiled loop.
+
+        Args:
+            returns (Sequence[float]): New daily returns, oldest first.
+
+        Returns:
+            np.ndarray: Sharpe ratio of the window after each return.
+        """
+        values = _as_vector(returns)
+        out = np.empty(values.shape[0], dtype=np.float64)
+        self._head = _rolling_sharpe_nb(
+            self._buffer, self._state, self._head, values, self.risk_free_rate, out
+        )
+        return out
+
+    def value(self) -> float:
+        """
+        Sharpe ratio of the current window.
+
+        Returns:
+            float: Sharpe ratio, 0.0 for an empty or constant window and NaN
+            while the window holds a NaN.
+        """
+        n, mean, m2, n_invalid = self._state
+        if n_invalid > 0:
+            return math.nan
+        if n == 0 or m2 <= 0.0:
+            return 0.0
+        return (mean - self.risk_free_rate) / math.sqrt(m2 / n)